@@ -11,6 +11,7 @@
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import fill
 import reader
 import index
@@ -19,6 +20,108 @@ from tools import data_print
 from tools import export_faces
 import os
 
+def _do_list(args, model, idx):
+    lt = args.list_type.strip().upper()
+    if lt == "ALL":
+        # Group by entity type and print names per type with basic wrapping
+        header = model.get('header')
+        if header is not None:
+            n_hdr = header.get('n_lines')
+            if not n_hdr:
+                n_hdr = len(header.get('lines', []) or [])
+            print(f"HEADER: {n_hdr} lines")
+        groups = {}
+        for e in model.get('entities', []):
+            cmd = e.get('command', '')
+            nm = e.get('name', '')
+            groups.setdefault(cmd, []).append(nm)
+        for cmd, names in groups.items():
+            print(f"{cmd} ({len(names)}):")
+            line = ', '.join(names)
+            print('  ' + fill(line, width=100, subsequent_indent='  '))
+    else:
+        names = query.list_names_by_type(idx, lt)
+        if not names:
+            print("(none)")
+        else:
+            # Pretty single-type listing
+            print(f"{lt} ({len(names)}):")
+            line = ', '.join(names)
+            print('  ' + fill(line, width=100, subsequent_indent='  '))
+
+def _do_plot_all(args, model, idx):
+    import plot
+    fig = plot.plot_all(
+        model,
+        idx,
+        projection=args.projection,
+        surf_iso_lines=args.surf_iso_lines,
+        surf_line_samples=args.surf_line_samples,
+    )
+    if fig is None:
+        print("No CONS or SURF entities to plot.")
+
+def _do_plot(args, model, idx):
+    import plot
+    plot.plot_entity(
+        model,
+        idx,
+        args.plot_name,
+        projection=args.projection,
+        surf_iso_lines=args.surf_iso_lines,
+        surf_line_samples=args.surf_line_samples,
+    )
+
+def _do_plot_data(args, model, idx):
+    data_print.print_entity_data(model, idx, args.plot_data_name)
+
+def _do_plot_face_uv(args, model, idx):
+    import plot
+    plot.plot_face_uv(
+        model,
+        idx,
+        args.plot_face_uv,
+        pcurve_samples=args.pcurve_samples,
+        show_local_midlines=not args.no_midlines,
+    )
+
+def _do_export_face_uv_loops(args, model, idx):
+    import plot
+    paths = plot.export_face_uv_loops(
+        model,
+        idx,
+        args.export_face_uv_loops,
+        out_dir=args.out_dir,
+        pcurve_samples=args.pcurve_samples,
+    )
+    for p in paths:
+        print(f"Exported loop CSV -> {p}")
+
+def _do_export_faces(args, model, idx):
+    f1, f2 = args.export_faces
+    out1 = os.path.join(args.out_dir, f1 + '.vda')
+    out2 = os.path.join(args.out_dir, f2 + '.vda')
+    os.makedirs(args.out_dir, exist_ok=True)
+    export_faces.write_face_file(model, idx, f1, out1)
+    export_faces.write_face_file(model, idx, f2, out2)
+    print(f"Exported {f1} -> {out1}")
+    print(f"Exported {f2} -> {out2}")
+
+# Option dest -> handler, run in this order for every option that is set
+DISPATCH = {
+    'list_type': _do_list,
+    'plot_all': _do_plot_all,
+    'plot_name': _do_plot,
+    'plot_data_name': _do_plot_data,
+    'plot_face_uv': _do_plot_face_uv,
+    'export_face_uv_loops': _do_export_face_uv_loops,
+    'export_faces': _do_export_faces,
+}
+
+# Options whose handlers import plot; all but the CSV export also draw (matplotlib)
+PLOT_OPTIONS = ('plot_all', 'plot_name', 'plot_face_uv', 'export_face_uv_loops')
+DRAW_OPTIONS = ('plot_all', 'plot_name', 'plot_face_uv')
+
 def main():
     ap = argparse.ArgumentParser(description="OpenVDAFS minimal tools")
     ap.add_argument("file", help="Path to .vda file")
@@ -40,93 +143,22 @@ def main():
     ap.add_argument("--out-dir", default="./exports", help="Output directory for exported VDA files")
     args = ap.parse_args()
 
-    model = reader.read_vdafs(args.file)
+    needs_plot = any(getattr(args, key) for key in PLOT_OPTIONS)
+    if needs_plot:
+        # Parse the file in a worker thread while plot (and matplotlib) is imported here
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            fut = ex.submit(reader.read_vdafs, args.file)
+            import plot
+            if any(getattr(args, key) for key in DRAW_OPTIONS):
+                import matplotlib.pyplot  # plot loads it lazily; do it during the parse
+            model = fut.result()
+    else:
+        model = reader.read_vdafs(args.file)
     idx = index.build_index(model)
 
-    if args.list_type:
-        lt = args.list_type.strip().upper()
-        if lt == "ALL":
-            # Group by entity type and print names per type with basic wrapping
-            header = model.get('header')
-            if header is not None:
-                n_hdr = header.get('n_lines')
-                if not n_hdr:
-                    n_hdr = len(header.get('lines', []) or [])
-                print(f"HEADER: {n_hdr} lines")
-            groups = {}
-            for e in model.get('entities', []):
-                cmd = e.get('command', '')
-                nm = e.get('name', '')
-                groups.setdefault(cmd, []).append(nm)
-            for cmd, names in groups.items():
-                print(f"{cmd} ({len(names)}):")
-                line = ', '.join(names)
-                print('  ' + fill(line, width=100, subsequent_indent='  '))
-        else:
-            names = query.list_names_by_type(idx, lt)
-            if not names:
-                print("(none)")
-            else:
-                # Pretty single-type listing
-                print(f"{lt} ({len(names)}):")
-                line = ', '.join(names)
-                print('  ' + fill(line, width=100, subsequent_indent='  '))
-
-    if args.plot_all:
-        import plot
-        plot.plot_all(
-            model,
-            idx,
-            projection=args.projection,
-            surf_iso_lines=args.surf_iso_lines,
-            surf_line_samples=args.surf_line_samples,
-        )
-
-    if args.plot_name:
-        import plot
-        plot.plot_entity(
-            model,
-            idx,
-            args.plot_name,
-            projection=args.projection,
-            surf_iso_lines=args.surf_iso_lines,
-            surf_line_samples=args.surf_line_samples,
-        )
-
-    if args.plot_data_name:
-        data_print.print_entity_data(model, idx, args.plot_data_name)
-
-    if args.plot_face_uv:
-        import plot
-        plot.plot_face_uv(
-            model,
-            idx,
-            args.plot_face_uv,
-            pcurve_samples=args.pcurve_samples,
-            show_local_midlines=not args.no_midlines,
-        )
-
-    if args.export_face_uv_loops:
-        import plot
-        paths = plot.export_face_uv_loops(
-            model,
-            idx,
-            args.export_face_uv_loops,
-            out_dir=args.out_dir,
-            pcurve_samples=args.pcurve_samples,
-        )
-        for p in paths:
-            print(f"Exported loop CSV -> {p}")
-
-    if args.export_faces:
-        f1, f2 = args.export_faces
-        out1 = os.path.join(args.out_dir, f1 + '.vda')
-        out2 = os.path.join(args.out_dir, f2 + '.vda')
-        os.makedirs(args.out_dir, exist_ok=True)
-        export_faces.write_face_file(model, idx, f1, out1)
-        export_faces.write_face_file(model, idx, f2, out2)
-        print(f"Exported {f1} -> {out1}")
-        print(f"Exported {f2} -> {out2}")
+    for key, handler in DISPATCH.items():
+        if getattr(args, key):
+            handler(args, model, idx)
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,8 @@
 # Decodes the params of a CURVE entity into per-segment structures, then
 # evaluates points either by global parameter t or by uniform sampling.
 
+import bisect
+
 def _decode_curve_params(params):
     """
     Decode a CURVE params list into:
@@ -9,7 +11,9 @@ def _decode_curve_params(params):
       - pars (list of n+1 global parameters)
       - segments: list of dicts with keys:
           {'order': K, 'ax': [...], 'ay': [...], 'az': [...], 't0': par[k], 't1': par[k+1]}
-    Returns a dict {'n': n, 'pars': pars, 'segments': segments}
+        with ax/ay/az as lists of floats (K each), plus ax_rev/ay_rev/az_rev
+        tuples holding the same coefficients highest power first
+    Returns a dict {'n': n, 'pars': pars, 'pars_f': pars as float tuple, 'segments': segments}
     """
     if not params or len(params) < 1:
         raise ValueError("CURVE has no parameters")
@@ -24,6 +28,7 @@ def _decode_curve_params(params):
     if len(params) < need:
         raise ValueError("CURVE missing global parameters")
     pars = params[1:1 + (n + 1)]
+    pars_f = tuple(float(p) for p in pars)
 
     # remaining are segment blocks: for each seg -> [K, K ax, K ay, K az]
     seg_data = params[1 + (n + 1):]
@@ -43,62 +48,105 @@ def _decode_curve_params(params):
         ay = seg_data[i: i + K]; i += K
         az = seg_data[i: i + K]; i += K
 
-        # sanity: all numbers?
-        for arr in (ax, ay, az):
-            for v in arr:
-                if not isinstance(v, (int, float)):
-                    raise ValueError("CURVE coefficients must be numeric")
+        # store as floats once so evaluation never mixes int/float arithmetic;
+        # the conversion doubles as the "all numbers?" sanity check
+        try:
+            ax = [float(v) for v in ax]
+            ay = [float(v) for v in ay]
+            az = [float(v) for v in az]
+        except (TypeError, ValueError):
+            raise ValueError("CURVE coefficients must be numeric")
 
-        t0, t1 = float(pars[k]), float(pars[k + 1])
+        t0, t1 = pars_f[k], pars_f[k + 1]
         if t1 == t0:
             raise ValueError("CURVE global parameter interval has zero length")
 
-        segs.append({'order': K, 'ax': ax, 'ay': ay, 'az': az, 't0': t0, 't1': t1})
+        segs.append({'order': K, 'ax': ax, 'ay': ay, 'az': az, 't0': t0, 't1': t1,
+                     # highest power first, for _eval_monomial_rev
+                     'ax_rev': tuple(reversed(ax)), 'ay_rev': tuple(reversed(ay)), 'az_rev': tuple(reversed(az))})
 
-    return {'n': n, 'pars': pars, 'segments': segs}
+    return {'n': n, 'pars': pars, 'pars_f': pars_f, 'segments': segs}
 
 
 def _eval_monomial(coeffs, u):
-    """Evaluate Σ c[j] u^j for j=0..K-1."""
-    # Horner would be faster; monomial is fine & clear:
+    """Evaluate Σ c[j] u^j for j=0..K-1 (Horner's scheme)."""
     s = 0.0
-    p = 1.0
-    for c in coeffs:
-        s += c * p
-        p *= u
+    for c in reversed(coeffs):
+        s = s * u + c
     return s
 
 
+def _eval_monomial_rev(rev_coeffs, u):
+    """Horner evaluation with coefficients already ordered c[K-1]..c[0]."""
+    s = 0.0
+    for c in rev_coeffs:
+        s = s * u + c
+    return s
+
+
+# Straight-line samplers per segment order K, generated on first use.
+_SEGMENT_SAMPLERS = {}
+
+
+def _segment_sampler(K):
+    """Return f(ax, ay, az, us) -> [(x,y,z), ...] specialised for order K.
+
+    The generated body unpacks the coefficients into locals and spells out
+    the Horner expression, e.g. for K=3: ((c2*u + c1)*u + c0), so sampling
+    runs without a per-coefficient Python loop.
+    """
+    f = _SEGMENT_SAMPLERS.get(K)
+    if f is None:
+        def horner(c):
+            expr = f"{c}{K - 1}"
+            for i in range(K - 2, -1, -1):
+                expr = f"({expr})*u + {c}{i}"
+            return expr
+
+        def unpack(c, name):
+            return ", ".join(f"{c}{i}" for i in range(K)) + f", = {name}"
+
+        src = (
+            "def _sample(ax, ay, az, us):\n"
+            f"    {unpack('x', 'ax')}\n"
+            f"    {unpack('y', 'ay')}\n"
+            f"    {unpack('z', 'az')}\n"
+            f"    return [({horner('x')}, {horner('y')}, {horner('z')}) for u in us]\n"
+        )
+        ns = {}
+        exec(compile(src, f"<curve_eval sampler K={K}>", "exec"), ns)
+        f = _SEGMENT_SAMPLERS[K] = ns['_sample']
+    return f
+
+
+def _sample_segment(ax, ay, az, us):
+    """Evaluate one segment at all local parameters in us; returns [(x,y,z), ...]."""
+    return _segment_sampler(len(ax))(ax, ay, az, us)
+
+
 def eval_curve_at_t(curve, t):
     """
     Evaluate decoded curve (from _decode_curve_params) at global parameter t.
     Returns (x, y, z).
     """
     segs = curve['segments']
-    pars = curve['pars']
+    pars_f = curve['pars_f']
 
     # Clamp t into [pars[0], pars[-1]] for robustness
-    tmin, tmax = float(pars[0]), float(pars[-1])
-    if t < tmin: t = tmin
-    if t > tmax: t = tmax
-
-    # Find segment k with t in [pars[k], pars[k+1]]; rightmost on boundary
-    # Linear scan is fine; n is usually small. Could be binary search later.
-    k = None
-    for i in range(len(segs)):
-        if t <= float(pars[i + 1]):
-            k = i
-            break
-    if k is None:
-        k = len(segs) - 1
+    if t < pars_f[0]: t = pars_f[0]
+    if t > pars_f[-1]: t = pars_f[-1]
+
+    # Find segment k with t in [pars[k], pars[k+1]]; leftmost on interior knots
+    # (first k with t <= pars[k+1]), by binary search over pars[1..n-1]
+    k = bisect.bisect_left(pars_f, t, 1, len(segs)) - 1
 
     seg = segs[k]
     t0, t1 = seg['t0'], seg['t1']
     u = (t - t0) / (t1 - t0)
 
-    x = _eval_monomial(seg['ax'], u)
-    y = _eval_monomial(seg['ay'], u)
-    z = _eval_monomial(seg['az'], u)
+    x = _eval_monomial_rev(seg['ax_rev'], u)
+    y = _eval_monomial_rev(seg['ay_rev'], u)
+    z = _eval_monomial_rev(seg['az_rev'], u)
     return (x, y, z)
 
 
@@ -113,19 +161,15 @@ def sample_curve(curve, samples_per_segment=20, include_knots=True, return_segme
     """
     pts = []
     seg_ranges = []  # optional output when return_segment_ranges=True
+    # local u samples, shared by all segments
+    m = max(2, int(samples_per_segment))
+    us_all = [j / float(m) for j in range(m + 1)]
+    # avoid duplicating interior knot if not include_knots
+    us_inner = us_all if include_knots else us_all[1:m]
     for idx, seg in enumerate(curve['segments']):
         start = len(pts)
-        # local u samples
-        m = max(2, int(samples_per_segment))
-        for j in range(m + (1 if include_knots or idx == 0 else 0)):
-            # generate u in [0,1]; avoid duplicating interior knot if not include_knots
-            if j == 0 and idx > 0 and not include_knots:
-                continue
-            u = j / float(m)
-            x = _eval_monomial(seg['ax'], u)
-            y = _eval_monomial(seg['ay'], u)
-            z = _eval_monomial(seg['az'], u)
-            pts.append((x, y, z))
+        us = us_all if idx == 0 else us_inner
+        pts.extend(_sample_segment(seg['ax'], seg['ay'], seg['az'], us))
         seg_ranges.append((idx, start, len(pts)))
     return (pts, seg_ranges) if return_segment_ranges else pts
 
@@ -138,3 +182,4 @@ def decode_curve_entity(entity):
     if entity.get('command') != 'CURVE':
         raise ValueError("Entity is not a CURVE")
     return _decode_curve_params(entity.get('params', []))
+
@@ -61,24 +61,40 @@ def decode_cons_entity(entity: Dict[str, Any]) -> Dict[str, Any]:
     # Parameter vector of length n+1
     if i + (n + 1) > len(params):
         return {'surf': surf, 'curve': curve, 't_range': (t_start, t_end), 'pc': None}
-    pars = []
-    for _ in range(n + 1):
-        pars.append(float(params[i])); i += 1
+    n_pars = max(n + 1, 0)
+    pars = list(map(float, params[i:i + n_pars]))
+    i += n_pars
 
     segments = []
+    # Fast path: every segment has the same order K, so the n blocks of
+    # (K, K s-coeffs, K t-coeffs) have a fixed stride and convert in one go
+    K = params[i] if i < len(params) and isinstance(params[i], int) else None
+    if n > 0 and K is not None and K > 0:
+        stride = 2 * K + 1
+        end = i + n * stride
+        if end <= len(params) and all(k == K for k in params[i:end:stride]):
+            vals = list(map(float, params[i:end]))
+            for k in range(n):
+                b = k * stride + 1
+                segments.append({'order': K, 'as': vals[b:b + K], 'at': vals[b + K:b + 2 * K],
+                                 't0': pars[k], 't1': pars[k + 1]})
+            pc = {'n': n, 'pars': pars, 'segments': segments}
+            return {'surf': surf, 'curve': curve, 't_range': (t_start, t_end), 'pc': pc}
+
+    # General path: per-segment order
     for k in range(n):
         if i >= len(params) or not isinstance(params[i], (int, float)):
             break
         K = _as_int(params[i]); i += 1
         if i + K > len(params):
             break
-        as_coeff = [float(params[i + j]) for j in range(K)]
+        as_coeff = list(map(float, params[i:i + K]))
         i += K
         if i + K > len(params):
             break
-        at_coeff = [float(params[i + j]) for j in range(K)]
+        at_coeff = list(map(float, params[i:i + K]))
         i += K
-        segments.append({'order': K, 'as': as_coeff, 'at': at_coeff, 't0': float(pars[k]), 't1': float(pars[k + 1])})
+        segments.append({'order': K, 'as': as_coeff, 'at': at_coeff, 't0': pars[k], 't1': pars[k + 1]})
 
     pc = {'n': len(segments), 'pars': pars, 'segments': segments}
     return {'surf': surf, 'curve': curve, 't_range': (t_start, t_end), 'pc': pc}
@@ -119,41 +135,45 @@ def decode_face_entity(entity: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("FACE first param must be SR reference")
 
     loops: List[Dict[str, Any]] = []
+    n_params = len(params)
+    # Pre-scan token types once: 1 = numeric, 0 = reference/other
+    is_num = bytes(1 if isinstance(p, (int, float)) else 0 for p in params)
     i = 1
 
     # Detect and skip optional explicit loop count
-    if i < len(params) and isinstance(params[i], (int, float)):
+    if i < n_params and is_num[i]:
         # Peek ahead to decide if this looks like nloops (followed by another int)
         try:
             nloops = _as_int(params[i])
-            if i + 1 < len(params) and isinstance(params[i + 1], (int, float)):
+            if i + 1 < n_params and is_num[i + 1]:
                 # treat as explicit count and skip it; we'll parse by counts anyway
                 i += 1
         except Exception:
             pass
 
     # Parse repeated: count, then count blocks of (CNref, u, v)
-    while i < len(params):
-        # A count must be numeric
-        if not isinstance(params[i], (int, float)):
+    while i < n_params:
+        # A count must be numeric (already known from the pre-scan, so only
+        # NaN/inf can still fail the integer conversion)
+        if not is_num[i]:
             break
         try:
-            cnt = _as_int(params[i])
-        except Exception:
+            cnt = int(round(params[i]))
+        except (ValueError, OverflowError):
             break
         i += 1
-        items = []
-        for _ in range(cnt):
-            if i + 2 >= len(params):
-                break
-            cons_ref = params[i]; i += 1
-            u = params[i]; i += 1
-            v = params[i]; i += 1
+        # Up to cnt complete triplets, read as strided slices
+        n = min(max(cnt, 0), (n_params - i) // 3)
+        end = i + 3 * n
+        refs = params[i:end:3]
+        for k, cons_ref in enumerate(refs):
             if not (isinstance(cons_ref, str) and cons_ref.startswith('CN')):
                 # Not a CONS reference; stop parsing this loop
-                i -= 3
+                n = k
                 break
-            items.append({'cons': cons_ref, 'u': float(u), 'v': float(v)})
+        items = [{'cons': cons_ref, 'u': float(u), 'v': float(v)}
+                 for cons_ref, u, v in zip(refs[:n], params[i + 1:end:3], params[i + 2:end:3])]
+        i += 3 * n
         if items:
             loops.append({'count': len(items), 'items': items})
         else:
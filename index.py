@@ -1,18 +1,14 @@
 # Build simple indices over the parsed model for fast lookup.
+from collections import defaultdict
 
 def build_index(model):
     by_name = {}
-    by_type = {}
+    by_type = defaultdict(list)
     for e in model['entities']:
         nm = e['name']
-        cmd = e['command']
         by_name[nm] = e
-        bucket = by_type.get(cmd)
-        if bucket is None:
-            bucket = []
-            by_type[cmd] = bucket
-        bucket.append(nm)
+        by_type[e['command']].append(nm)
     return {
         'by_name': by_name,
-        'by_type': by_type
+        'by_type': dict(by_type)  # plain dict: lookups of absent types must not insert
     }
@@ -1,6 +1,10 @@
 # Plotting helpers. One chart per call, no styles set.
-import matplotlib.pyplot as plt
+# matplotlib is imported inside the drawing functions, so importing this module
+# (projection helpers, export_face_uv_loops) does not pay for loading it.
+import numpy as np
+from numpy.polynomial import polynomial as npp
 import math
+from itertools import cycle, islice
 import curve_eval as ce
 import surf_eval as se
 import query as q
@@ -21,258 +25,405 @@ def _axis_labels(projection):
     else:
         return 'X', 'Y'  # default to xy
 
+# Isometric-like view: rotate 45° about Z, then 35.264° about X (precomputed once)
+_ISO_ANGLE_X = math.radians(35.26438968)
+_ISO_ANGLE_Z = math.radians(45)
+_ISO_COS_X, _ISO_SIN_X = math.cos(_ISO_ANGLE_X), math.sin(_ISO_ANGLE_X)
+_ISO_COS_Z, _ISO_SIN_Z = math.cos(_ISO_ANGLE_Z), math.sin(_ISO_ANGLE_Z)
+
+# Fixed color cycles, built once (CURVE segments / FACE uv loop items)
+_SEGMENT_COLORS = ('blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan')
+_LOOP_COLORS = ('tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple', 'tab:brown', 'tab:pink', 'tab:gray', 'tab:olive', 'tab:cyan')
+
+def _proj_xy(p):
+    return (p[0], p[1])
+
+def _proj_xz(p):
+    return (p[0], p[2])
+
+def _proj_yz(p):
+    return (p[1], p[2])
+
+def _proj_iso(p):
+    # Simple isometric-like projection (no perspective): rotate axes to 30°/35.264°
+    # Reference: isometric projection matrix with rotations about X and Z.
+    x, y, z = p[:3]  # handle both tuples and arrays
+    # Rotate around Z
+    xr = x * _ISO_COS_Z - y * _ISO_SIN_Z
+    yr = x * _ISO_SIN_Z + y * _ISO_COS_Z
+    # Then rotate around X and drop Z
+    yr2 = yr * _ISO_COS_X - z * _ISO_SIN_X
+    return (xr, yr2)
+
+_PROJECTORS = {'xy': _proj_xy, 'xz': _proj_xz, 'yz': _proj_yz, 'iso': _proj_iso}
+
+def _planar_components(projection):
+    """xyz indices kept by an axis-aligned projection, or None for 'iso'."""
+    if projection == 'iso':
+        return None
+    return {'xz': (0, 2), 'yz': (1, 2)}.get(projection, (0, 1))  # xy and default
+
+def _get_projector(projection):
+    """Resolve a projection name once into a point -> (a, b) function (default xy)."""
+    return _PROJECTORS.get(projection, _proj_xy)
+
 def _project_point(point, projection):
-    """Project a 3D point to 2D based on the projection type."""
-    x, y, z = point[:3]  # handle both tuples and arrays
-    if projection == 'xy':
-        return (x, y)
-    elif projection == 'xz':
-        return (x, z)
-    elif projection == 'yz':
-        return (y, z)
-    elif projection == 'iso':
-        # Simple isometric-like projection (no perspective): rotate axes to 30°/35.264°
-        # Using a common approximation: u = x - y, v = (x + y)/2 - z * 0.816
-        # We'll use a normalized variant to keep scales reasonable.
-        # Reference: isometric projection matrix with rotations about X and Z.
-        import math
-        angle_x = math.radians(35.26438968)
-        angle_z = math.radians(45)
-        # Rotate around Z
-        xr = x * math.cos(angle_z) - y * math.sin(angle_z)
-        yr = x * math.sin(angle_z) + y * math.cos(angle_z)
-        zr = z
-        # Then rotate around X
-        yr2 = yr * math.cos(angle_x) - zr * math.sin(angle_x)
-        zr2 = yr * math.sin(angle_x) + zr * math.cos(angle_x)
-        # Drop Z
-        return (xr, yr2)
-    else:
-        return (x, y)  # default to xy
+    """Project a 3D point to 2D based on the projection type.
+
+    For many points resolve the function once with _get_projector, or use the
+    vectorised _project_points.
+    """
+    return _get_projector(projection)(point)
+
+def _project_points(points, projection):
+    """Project many 3D points at once (same rules as _project_point).
+
+    points: (N,3) array or sequence of (x,y,z). Returns (xs, ys) as 1D arrays.
+    """
+    pts = np.asarray(points, dtype=float).reshape(-1, 3)
+    x, y, z = pts[:, 0], pts[:, 1], pts[:, 2]
+    if projection == 'xz':
+        return x, z
+    if projection == 'yz':
+        return y, z
+    if projection == 'iso':
+        xr = x * _ISO_COS_Z - y * _ISO_SIN_Z
+        yr = x * _ISO_SIN_Z + y * _ISO_COS_Z
+        return xr, yr * _ISO_COS_X - z * _ISO_SIN_X
+    return x, y  # xy and default
+
+def _project_lines(lines, projection):
+    """Project equal-length 3D polylines in one batch: (L,S,3) -> (L,S,2) array."""
+    arr = np.asarray(lines, dtype=float)
+    if arr.size == 0:
+        return np.empty((0, 2, 2))
+    xs, ys = _project_points(arr, projection)
+    return np.stack((xs, ys), axis=-1).reshape(arr.shape[0], arr.shape[1], 2)
+
+def _xyz_array(params):
+    """Numeric params of a POINT/PSET/MDI entity as an (N,3) array."""
+    arr = np.fromiter((v for v in params if isinstance(v, (int, float))), dtype=float)
+    if arr.size % 3 != 0:
+        raise ValueError("Entity does not contain 3D point triplets.")
+    return arr.reshape(-1, 3)
+
+def _decode_xyz(entity):
+    """Decoder for q.decode_cached: POINT/PSET/MDI params as a cached (N,3) array."""
+    return _xyz_array(entity.get('params', []))
+
+def _sample_curve_segments(curve, samples_per_segment):
+    """Sample every CURVE segment on [0,1]; one (k,3) array per segment.
+
+    Interior knots are shared, so every segment after the first drops its
+    start point (the previous segment already ends there).
+    """
+    m = max(2, int(samples_per_segment))
+    us_all = [j / float(m) for j in range(m + 1)]
+    us_next = us_all[1:]
+    return [np.array(ce._sample_segment(seg['ax'], seg['ay'], seg['az'], us_all if k == 0 else us_next),
+                     dtype=float).reshape(-1, 3)
+            for k, seg in enumerate(curve['segments'])]
 
 """
 Note: FACE triangulation and trimming have been removed per request. This module now
 only draws CONS (via their referenced CURVEs) and SURF wireframes.
 """
 
-def _plot_xyz_points(xyz, title=None, colors=None, segment_labels=None, projection='xy'):
-    if not xyz:
+def _plot_xyz_points(xyz, title=None, colors=None, segment_labels=None, projection='xy', ax=None,
+                     show_markers=False):
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+    if len(xyz) == 0:
         raise ValueError("No points to plot.")
 
-    # Apply projection to points
-    projected_points = [_project_point(p, projection) for p in xyz]
-    xs = [p[0] for p in projected_points]
-    ys = [p[1] for p in projected_points]
+    # Apply projection to all points at once
+    xs, ys = _project_points(xyz, projection)
 
-    plt.figure()
+    own = ax is None
+    if own:
+        ax = plt.figure().gca()
 
     if colors is None or segment_labels is None:
         # Single color plot (for points, etc.)
-        plt.plot(xs, ys, marker='o')
+        ax.plot(xs, ys, marker='o' if show_markers else None)
     else:
-        # Multi-segment plot with different colors
-        start_idx = 0
-        for i, (color, label) in enumerate(zip(colors, segment_labels)):
-            end_idx = start_idx + label['point_count']
-            segment_xs = xs[start_idx:end_idx]
-            segment_ys = ys[start_idx:end_idx]
-            plt.plot(segment_xs, segment_ys, marker='o', color=color,
-                    label=f"Segment {i+1}", linewidth=2, markersize=4)
-            start_idx = end_idx
-        plt.legend()
+        # Multi-segment plot with different colors: all segment polylines in
+        # one LineCollection, markers (optional) in one scatter, proxy legend entries
+        xy = np.column_stack((xs, ys))
+        seg_colors = list(colors[:len(segment_labels)])
+        counts = np.array([lbl['point_count'] for lbl in segment_labels[:len(seg_colors)]], dtype=int)
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        segs = [xy[offsets[i]:offsets[i + 1]] for i in range(len(counts))]  # views
+        handles = [Line2D([], [], marker='o' if show_markers else None, color=color,
+                          label=f"Segment {i+1}", linewidth=2, markersize=4)
+                   for i, color in enumerate(seg_colors)]
+        ax.add_collection(LineCollection(segs, colors=seg_colors, linewidths=2))
+        if show_markers:
+            n = offsets[-1]
+            ax.scatter(xy[:n, 0], xy[:n, 1], c=np.repeat(seg_colors, counts), s=16, zorder=2)
+        ax.autoscale_view()
+        ax.legend(handles=handles)
 
     if title:
-        plt.title(title)
+        ax.set_title(title)
+    xl, yl = _axis_labels(projection)
+    ax.set_xlabel(xl)
+    ax.set_ylabel(yl)
+    ax.axis('equal')
+    if own:
+        plt.show()
+
+def _plot_points_entity(e, projection, ax, samples_per_segment, surf_iso_lines, surf_line_samples):
+    # naive attempt: treat params as flat xyz list
+    xyz = q.decode_cached(e, _decode_xyz)
+    _plot_xyz_points(xyz, title=f"{e['name']} ({e['command']})", projection=projection, ax=ax,
+                     show_markers=True)
+
+def _plot_curve_entity(e, projection, ax, samples_per_segment, surf_iso_lines, surf_line_samples):
+    curve = q.decode_cached(e, ce.decode_curve_entity)
+
+    # Cycle the predefined segment colors
+    colors = list(islice(cycle(_SEGMENT_COLORS), curve['n']))
+
+    # Sample each segment separately to track segment boundaries
+    chunks = _sample_curve_segments(curve, samples_per_segment)
+    segment_info = [{'point_count': len(c)} for c in chunks]
+
+    # One contiguous (N,3) array; the plot helper slices columns from it
+    all_points = np.concatenate(chunks) if chunks else np.empty((0, 3))
+    _plot_xyz_points(all_points, title=f"{e['name']} (CURVE)",
+                    colors=colors, segment_labels=segment_info, projection=projection, ax=ax)
+
+def _plot_surf_entity(e, projection, ax, samples_per_segment, surf_iso_lines, surf_line_samples):
+    from matplotlib.collections import LineCollection
+    surf = q.decode_cached(e, se.decode_surf_entity)
+
+    # Create wireframe by plotting patch boundaries
+    # This is a simplified wireframe - just plot some iso-parameter lines
+    # Build equally spaced parameter samples; keep same density for u and v for now
+    iso_vals = np.linspace(0.0, 1.0, max(2, int(surf_iso_lines)))
+    samp_vals = np.linspace(0.0, 1.0, max(2, int(surf_line_samples)))
+
+    # Collect all lines, project each style in one batch, draw as one LineCollection
+    u_lines, v_lines = _surf_wire_lines(surf, iso_vals, samp_vals)
+    # u-direction iso-lines (vary v along line), v-direction (vary u along line)
+    u_segs = _project_lines(u_lines, projection)
+    v_segs = _project_lines(v_lines, projection)
+
+    ax.add_collection(LineCollection(u_segs, colors='gray', linewidths=0.8))
+    ax.add_collection(LineCollection(v_segs, colors='black', linewidths=0.8, alpha=0.7))
+    ax.autoscale_view()
+
+    ax.set_title(f"{e['name']} (SURF wireframe: {projection})")
     xl, yl = _axis_labels(projection)
-    plt.xlabel(xl)
-    plt.ylabel(yl)
-    plt.axis('equal')
-    plt.show()
+    ax.set_xlabel(xl)
+    ax.set_ylabel(yl)
+    ax.axis('equal')
+
+# Entity type -> plot_entity handler
+_PLOT_HANDLERS = {
+    'POINT': _plot_points_entity,
+    'PSET': _plot_points_entity,
+    'MDI': _plot_points_entity,
+    'CURVE': _plot_curve_entity,
+    'SURF': _plot_surf_entity,
+}
 
 def plot_entity(model, idx, name, samples_per_segment=30, projection='xy',
-                surf_iso_lines=3, surf_line_samples=5):
+                surf_iso_lines=3, surf_line_samples=5, ax=None, show=True):
+    """Plot one entity. With ax given, draw into it and leave showing to the caller.
+
+    Returns the figure; show=False skips plt.show() (e.g. to savefig in batch runs).
+    """
+    import matplotlib.pyplot as plt
     e = idx['by_name'].get(name)
     if not e:
         raise KeyError("No such entity: " + name)
     cmd = e['command']
+    handler = _PLOT_HANDLERS.get(cmd)
+    if handler is None:
+        raise NotImplementedError(f"Plotting for entity type '{cmd}' is not implemented.")
+    own = ax is None
+    if own:
+        ax = plt.figure().gca()
+    handler(e, projection, ax, samples_per_segment, surf_iso_lines, surf_line_samples)
+    if own and show:
+        plt.show()
+    return ax.figure
 
-    if cmd in ('POINT', 'PSET', 'MDI'):
-        # naive attempt: treat params as flat xyz list
-        nums = [v for v in e.get('params', []) if isinstance(v, (int,float))]
-        if len(nums) % 3 != 0:
-            raise ValueError("Entity does not contain 3D point triplets.")
-        xyz = []
-        it = iter(nums)
-        for x in it:
-            y = next(it); z = next(it)
-            xyz.append((float(x), float(y), float(z)))
-        _plot_xyz_points(xyz, title=f"{e['name']} ({cmd})", projection=projection)
-        return
+def plot_entities(model, idx, names, cols=3, show=True, **kwargs):
+    """Plot several entities as subplots of a single figure (one show at the end).
 
-    if cmd == 'CURVE':
-        curve = ce.decode_curve_entity(e)
-
-        # Generate colors for segments using a predefined color list
-        color_palette = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
-        n_segments = curve['n']
-        colors = [color_palette[i % len(color_palette)] for i in range(n_segments)]
-
-        # Sample each segment separately to track segment boundaries
-        all_points = []
-        segment_info = []
-
-        for idx, seg in enumerate(curve['segments']):
-            # Sample this segment
-            seg_curve = {'n': 1, 'pars': [seg['t0'], seg['t1']], 'segments': [seg]}
-            seg_points = ce.sample_curve(seg_curve, samples_per_segment=samples_per_segment, include_knots=True)
-
-            # Avoid duplicating points at segment boundaries (except for first segment)
-            if idx > 0 and all_points:
-                seg_points = seg_points[1:]  # Skip first point to avoid duplication
-
-            all_points.extend(seg_points)
-            segment_info.append({'point_count': len(seg_points)})
-
-        _plot_xyz_points(all_points, title=f"{e['name']} (CURVE)",
-                        colors=colors, segment_labels=segment_info, projection=projection)
-        return
-
-    if cmd == 'SURF':
-        surf = se.decode_surf_entity(e)
-        # Get vertices and faces from surface sampling
-        vertices, faces = se.sample_surf(surf, nu=12, nv=12)
-
-        plt.figure()
-
-        # Create wireframe by plotting patch boundaries
-        # This is a simplified wireframe - just plot some iso-parameter lines
-        n_patches = len(surf['patches'])
-        # Build equally spaced parameter samples; keep same density for u and v for now
-        def _linspace01(n):
-            n = max(2, int(n))
-            if n == 2:
-                return [0.0, 1.0]
-            step = 1.0 / float(n - 1)
-            return [i * step for i in range(n)]
-
-        iso_vals = _linspace01(surf_iso_lines)
-        samp_vals = _linspace01(surf_line_samples)
-
-        for i, patch in enumerate(surf['patches']):
-            # u-direction iso-lines (vary v along line)
-            for u_val in iso_vals:
-                line_points = []
-                for v_val in samp_vals:
-                    x, y, z = se._eval_monomial2(
-                        patch['ax'], patch['ay'], patch['az'],
-                        patch['jor'], patch['kor'], u_val, v_val
-                    )
-                    line_points.append((x, y, z))
-                proj = [_project_point(p, projection) for p in line_points]
-                xs = [p[0] for p in proj]
-                ys = [p[1] for p in proj]
-                plt.plot(xs, ys, color='gray', linewidth=0.8)
-
-            # v-direction iso-lines (vary u along line)
-            for v_val in iso_vals:
-                line_points = []
-                for u_val in samp_vals:
-                    x, y, z = se._eval_monomial2(
-                        patch['ax'], patch['ay'], patch['az'],
-                        patch['jor'], patch['kor'], u_val, v_val
-                    )
-                    line_points.append((x, y, z))
-                proj = [_project_point(p, projection) for p in line_points]
-                xs = [p[0] for p in proj]
-                ys = [p[1] for p in proj]
-                plt.plot(xs, ys, color='black', linewidth=0.8, alpha=0.7)
-
-        plt.title(f"{e['name']} (SURF wireframe: {projection})")
-        xl, yl = _axis_labels(projection)
-        plt.xlabel(xl)
-        plt.ylabel(yl)
-        plt.axis('equal')
+    Extra keyword arguments are passed on to plot_entity. Returns the figure.
+    """
+    import matplotlib.pyplot as plt
+    names = list(names)
+    if not names:
+        raise ValueError("No entities to plot.")
+    cols = max(1, min(int(cols), len(names)))
+    rows = (len(names) + cols - 1) // cols
+    fig, axes = plt.subplots(rows, cols, figsize=(5 * cols, 4 * rows), squeeze=False)
+    flat = axes.ravel()
+    for ax, name in zip(flat, names):
+        plot_entity(model, idx, name, ax=ax, **kwargs)
+    for ax in flat[len(names):]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    if show:
         plt.show()
-        return
+    return fig
+
+def _curve_wire_points(curve, samples_per_segment):
+    """All sample points of a decoded CURVE as one (N,3) array (None if empty)."""
+    chunks = _sample_curve_segments(curve, samples_per_segment)
+    return np.concatenate(chunks) if chunks else None
+
+def _eval_patch_grid(coeffs, us, vs):
+    """Evaluate P same-order patches on a us x vs grid with batched Horner.
 
-    raise NotImplementedError(f"Plotting for entity type '{cmd}' is not implemented.")
+    coeffs: (P, 3, jor, kor) array of x/y/z monomial coefficients (u^j v^k).
+    Returns (P, 3, len(us), len(vs)).
+    """
+    # Collapse the v powers first: c[p, xyz, j, b] = sum_k a[p, xyz, j, k] * vs[b]^k
+    c = np.zeros(coeffs.shape[:3] + (len(vs),))
+    for k in range(coeffs.shape[3] - 1, -1, -1):
+        c = c * vs + coeffs[..., k, None]
+    # Then the u powers: g[p, xyz, a, b] = sum_j c[p, xyz, j, b] * us[a]^j
+    g = np.zeros(coeffs.shape[:2] + (len(us), len(vs)))
+    for j in range(coeffs.shape[2] - 1, -1, -1):
+        g = g * us[:, None] + c[:, :, j, None, :]
+    return g
+
+def _surf_coeff_groups(surf):
+    """Patch coefficients as (member indices, (P, 3, jor, kor) array) per patch order.
+
+    Built once per decoded SURF and kept on it ('_coeff_groups'), so repeated
+    wireframe plots skip the list -> array conversion.
+    """
+    groups = surf.get('_coeff_groups')
+    if groups is None:
+        patches = surf.get('patches', [])
+        by_order = {}
+        for i, p in enumerate(patches):
+            by_order.setdefault((p['jor'], p['kor']), []).append(i)
+        groups = []
+        for (jor, kor), members in by_order.items():
+            coeffs = np.array([(patches[i]['ax'], patches[i]['ay'], patches[i]['az']) for i in members],
+                              dtype=float).reshape(len(members), 3, jor, kor)
+            groups.append((members, coeffs))
+        surf['_coeff_groups'] = groups
+    return groups
+
+def _surf_wire_lines(surf, iso_vals, samp_vals, comps=None):
+    """(u_lines, v_lines) of every patch of a decoded SURF, as (L,S,3) arrays.
+
+    Patches are grouped by order so each group is evaluated in one batch.
+    With comps (e.g. (0, 2) for 'xz') only those coordinates are evaluated and
+    the lines come back already projected, as (L,S,len(comps)).
+    """
+    patches = surf.get('patches', [])
+    isos = np.asarray(iso_vals, dtype=float)
+    samps = np.asarray(samp_vals, dtype=float)
+    n_iso, n_samp = len(isos), len(samps)
+    n_comp = 3 if comps is None else len(comps)
+    u_out = np.empty((len(patches), n_iso, n_samp, n_comp))
+    v_out = np.empty((len(patches), n_iso, n_samp, n_comp))
+    for members, coeffs in _surf_coeff_groups(surf):
+        if comps is not None:
+            coeffs = coeffs[:, list(comps)]
+        # u-lines: u fixed at iso values, v runs over the samples (and vice versa)
+        u_out[members] = _eval_patch_grid(coeffs, isos, samps).transpose(0, 2, 3, 1)
+        v_out[members] = _eval_patch_grid(coeffs, samps, isos).transpose(0, 3, 2, 1)
+    return u_out.reshape(-1, n_samp, n_comp), v_out.reshape(-1, n_samp, n_comp)
 
 def plot_all(model, idx, projection='xy', samples_per_segment=30,
-             surf_iso_lines=3, surf_line_samples=5):
+             surf_iso_lines=3, surf_line_samples=5, show=True):
     """
     Plot all CONS (as their referenced 3D CURVEs) and SURF entities in one figure.
+
+    Decoding happens up front, then sampling (no matplotlib calls), then all
+    drawing.
+    Returns the figure (None when the model has no CONS or SURF to plot); with
+    show=False it is built with interactive mode off and not shown, for
+    scripted exports (fig.savefig).
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
     cons_names = q.list_names_by_type(idx, 'CONS')
     surf_names = q.list_names_by_type(idx, 'SURF')
+    if not cons_names and not surf_names:
+        return None
 
-    plt.figure(figsize=(16, 10))
-    ax = plt.gca()
-
-    # Draw CONS by sampling their referenced CURVEs in 3D
+    # Decode CONS -> referenced CURVEs, and SURFs (entities that fail are skipped)
+    by_name = idx['by_name']
+    curves = []
     for cname in cons_names:
-        econs = q.get_entity(idx, cname)
+        econs = by_name.get(cname)
         if not econs:
             continue
         try:
-            cons = fe.decode_cons_entity(econs)
+            cons = q.decode_cached(econs, fe.decode_cons_entity)
         except Exception:
             continue
         cv_ref = cons.get('curve')
         if not cv_ref:
             continue
-        ecv = q.get_entity(idx, cv_ref)
+        ecv = by_name.get(cv_ref)
         if not ecv:
             continue
         try:
-            curve = ce.decode_curve_entity(ecv)
+            curves.append(q.decode_cached(ecv, ce.decode_curve_entity))
         except Exception:
             continue
-        all_points = []
-        for sidx, seg in enumerate(curve['segments']):
-            seg_curve = {'n': 1, 'pars': [seg['t0'], seg['t1']], 'segments': [seg]}
-            seg_points = ce.sample_curve(seg_curve, samples_per_segment=samples_per_segment, include_knots=True)
-            if sidx > 0 and all_points:
-                seg_points = seg_points[1:]
-            all_points.extend(seg_points)
-        if not all_points:
-            continue
-        proj = [_project_point(p, projection) for p in all_points]
-        ax.plot([p[0] for p in proj], [p[1] for p in proj], linewidth=1.4, alpha=0.95)
-
-    # Draw SURF wireframes
-    def _linspace01(n):
-        n = max(2, int(n))
-        if n == 2:
-            return [0.0, 1.0]
-        step = 1.0 / float(n - 1)
-        return [i * step for i in range(n)]
-
-    iso_vals = _linspace01(surf_iso_lines)
-    samp_vals = _linspace01(surf_line_samples)
 
+    surfs = []
     for sname in surf_names:
-        e = q.get_entity(idx, sname)
+        e = by_name.get(sname)
         try:
-            surf = se.decode_surf_entity(e)
+            surfs.append(q.decode_cached(e, se.decode_surf_entity))
         except Exception:
             continue
-        for patch in surf.get('patches', []):
-            # u-lines
-            for u_val in iso_vals:
-                line_points = []
-                for v_val in samp_vals:
-                    x, y, z = se._eval_monomial2(patch['ax'], patch['ay'], patch['az'], patch['jor'], patch['kor'], u_val, v_val)
-                    line_points.append((x, y, z))
-                proj = [_project_point(p, projection) for p in line_points]
-                ax.plot([p[0] for p in proj], [p[1] for p in proj], color='gray', linewidth=0.6, alpha=0.6)
-            # v-lines
-            for v_val in iso_vals:
-                line_points = []
-                for u_val in samp_vals:
-                    x, y, z = se._eval_monomial2(patch['ax'], patch['ay'], patch['az'], patch['jor'], patch['kor'], u_val, v_val)
-                    line_points.append((x, y, z))
-                proj = [_project_point(p, projection) for p in line_points]
-                ax.plot([p[0] for p in proj], [p[1] for p in proj], color='black', linewidth=0.6, alpha=0.5)
+
+    iso_vals = np.linspace(0.0, 1.0, max(2, int(surf_iso_lines)))
+    samp_vals = np.linspace(0.0, 1.0, max(2, int(surf_line_samples)))
+
+    # Sample curves and wireframe lines; axis-aligned views only evaluate the
+    # two surface coordinates they show
+    comps = _planar_components(projection)
+    curve_pts = [_curve_wire_points(c, samples_per_segment) for c in curves]
+    surf_lines = [_surf_wire_lines(sf, iso_vals, samp_vals, comps) for sf in surfs]
+
+    if show:
+        fig = plt.figure(figsize=(16, 10))
+    else:
+        with plt.ioff():
+            fig = plt.figure(figsize=(16, 10))
+    ax = fig.gca()
+
+    # Draw CONS by their referenced CURVEs: one collection, colored per curve
+    # from the property cycle as separate ax.plot() calls would be
+    cons_segs = [np.column_stack(_project_points(pts, projection))
+                 for pts in curve_pts if pts is not None]
+    if cons_segs:
+        cycle_colors = plt.rcParams['axes.prop_cycle'].by_key().get('color', ['C0'])
+        ax.add_collection(LineCollection(cons_segs, colors=list(islice(cycle(cycle_colors), len(cons_segs))),
+                                         linewidths=1.4, alpha=0.95))
+        ax.autoscale_view()
+
+    # Draw SURF wireframes: one artist per line style instead of one per iso-line
+    empty = [np.empty((0, len(samp_vals), 3 if comps is None else 2))]
+    u_segs = np.concatenate([u for u, _ in surf_lines] or empty)
+    v_segs = np.concatenate([v for _, v in surf_lines] or empty)
+    if len(u_segs):
+        if comps is None:
+            u_segs = _project_lines(u_segs, projection)
+            v_segs = _project_lines(v_segs, projection)
+        ax.add_collection(LineCollection(u_segs, colors='gray', linewidths=0.6, alpha=0.6))
+        ax.add_collection(LineCollection(v_segs, colors='black', linewidths=0.6, alpha=0.5))
+        ax.autoscale_view()
+    # Everything is drawn: freeze the limits instead of re-autoscaling later
+    ax.set_autoscale_on(False)
 
     # Finalize
     xl, yl = _axis_labels(projection)
@@ -282,91 +433,93 @@ def plot_all(model, idx, projection='xy', samples_per_segment=30,
     ax.set_title(f"All entities: {len(cons_names)} CONS, {len(surf_names)} SURF ({projection})")
     # make axis equal
     ax.set_box_aspect(1)  # aspect ratio 1:1
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 # (FACE triangulation helpers removed)
 
-def plot_entity_data(model, idx, name):
-    """Plot the raw data/parameters of an entity (e.g., order and coefficients for CURVE)."""
+def plot_entity_data(model, idx, name, show=True):
+    """Plot the raw data/parameters of an entity (e.g., order and coefficients for CURVE).
+
+    Returns the figure; show=False skips plt.show().
+    """
+    import matplotlib.pyplot as plt
     e = idx['by_name'].get(name)
     if not e:
         raise KeyError("No such entity: " + name)
     cmd = e['command']
 
     if cmd == 'CURVE':
-        curve = ce.decode_curve_entity(e)
-        _plot_curve_data(curve, e['name'])
-        return
-
-    if cmd in ('POINT', 'PSET', 'MDI'):
-        _plot_point_data(e)
-        return
-
-    if cmd == 'SURF':
-        _plot_surf_data(e)
-        return
+        curve = q.decode_cached(e, ce.decode_curve_entity)
+        fig = _plot_curve_data(curve, e['name'])
+    elif cmd in ('POINT', 'PSET', 'MDI'):
+        fig = _plot_point_data(e)
+    elif cmd == 'SURF':
+        fig = _plot_surf_data(e)
+    else:
+        raise NotImplementedError(f"Data plotting for entity type '{cmd}' is not implemented.")
+    if show:
+        plt.show()
+    return fig
 
-    raise NotImplementedError(f"Data plotting for entity type '{cmd}' is not implemented.")
+# Above this many segments _plot_curve_data groups all segments on three axes
+_CURVE_DATA_GRID_MAX = 8
 
 def _plot_curve_data(curve, name):
     """Plot CURVE order and coefficients as bar charts."""
+    import matplotlib.pyplot as plt
     n_segments = curve['n']
     segments = curve['segments']
-
-    # Create subplots for each segment
-    fig, axes = plt.subplots(n_segments, 3, figsize=(15, 4 * n_segments))
-    if n_segments == 1:
-        axes = axes.reshape(1, -1)
+    idx = np.arange(max(seg['order'] for seg in segments))
+    columns = (('ax', 'X', 'red'), ('ay', 'Y', 'green'), ('az', 'Z', 'blue'))
+
+    if n_segments > _CURVE_DATA_GRID_MAX:
+        # Many segments: one axes per coordinate, segments as grouped bars
+        fig, axes = plt.subplots(1, 3, figsize=(15, 5), sharex=True, constrained_layout=True)
+        fig.suptitle(f"CURVE Data: {name} ({n_segments} segments)", fontsize=16)
+        width = 0.8 / n_segments
+        seg_colors = list(islice(cycle(_SEGMENT_COLORS), n_segments))
+        for k, (key, label, _) in enumerate(columns):
+            axk = axes[k]
+            for i, seg in enumerate(segments):
+                axk.bar(idx[:seg['order']] + (i - 0.5 * (n_segments - 1)) * width,
+                        np.asarray(seg[key], dtype=float), width=width,
+                        color=seg_colors[i], alpha=0.7, label=f"Segment {i+1}")
+            axk.set_title(f"{label} Coefficients")
+            axk.set_xlabel("Coefficient Index")
+            axk.set_ylabel("Value")
+        axes[2].legend(fontsize=7, ncol=2)
+        return fig
+
+    # Create subplots for each segment; the coefficient index axis is shared
+    fig, axes = plt.subplots(n_segments, 3, figsize=(15, 4 * n_segments),
+                             sharex=True, squeeze=False, constrained_layout=True)
 
     fig.suptitle(f"CURVE Data: {name}", fontsize=16)
 
     for i, seg in enumerate(segments):
         order = seg['order']
-        ax = seg['ax']
-        ay = seg['ay']
-        az = seg['az']
-
-        # Plot X coefficients
-        axes[i, 0].bar(range(order), ax, color='red', alpha=0.7)
-        axes[i, 0].set_title(f"Segment {i+1} - X Coefficients (Order {order})")
-        axes[i, 0].set_xlabel("Coefficient Index")
-        axes[i, 0].set_ylabel("Value")
-
-        # Plot Y coefficients
-        axes[i, 1].bar(range(order), ay, color='green', alpha=0.7)
-        axes[i, 1].set_title(f"Segment {i+1} - Y Coefficients (Order {order})")
-        axes[i, 1].set_xlabel("Coefficient Index")
-        axes[i, 1].set_ylabel("Value")
-
-        # Plot Z coefficients
-        axes[i, 2].bar(range(order), az, color='blue', alpha=0.7)
-        axes[i, 2].set_title(f"Segment {i+1} - Z Coefficients (Order {order})")
-        axes[i, 2].set_xlabel("Coefficient Index")
-        axes[i, 2].set_ylabel("Value")
+        for k, (key, label, color) in enumerate(columns):
+            axk = axes[i, k]
+            axk.bar(idx[:order], np.asarray(seg[key], dtype=float), color=color, alpha=0.7)
+            axk.set_title(f"Segment {i+1} - {label} Coefficients (Order {order})")
+            axk.set_xlabel("Coefficient Index")
+            axk.set_ylabel("Value")
 
-    plt.tight_layout()
-    plt.show()
+    return fig
 
 def _plot_point_data(entity):
     """Plot point/pset data as coordinates."""
-    params = entity.get('params', [])
-    nums = [v for v in params if isinstance(v, (int, float))]
-
-    if len(nums) % 3 != 0:
-        raise ValueError("Entity does not contain 3D point triplets.")
-
-    n_points = len(nums) // 3
-    xs, ys, zs = [], [], []
-
-    for i in range(n_points):
-        xs.append(nums[i * 3])
-        ys.append(nums[i * 3 + 1])
-        zs.append(nums[i * 3 + 2])
+    import matplotlib.pyplot as plt
+    xyz = q.decode_cached(entity, _decode_xyz)
+    n_points = xyz.shape[0]
+    xs, ys, zs = xyz[:, 0], xyz[:, 1], xyz[:, 2]
 
     fig, axes = plt.subplots(1, 3, figsize=(15, 4))
     fig.suptitle(f"{entity['command']} Data: {entity['name']}", fontsize=16)
 
-    point_indices = list(range(n_points))
+    point_indices = np.arange(n_points)
 
     axes[0].bar(point_indices, xs, color='red', alpha=0.7)
     axes[0].set_title("X Coordinates")
@@ -384,62 +537,103 @@ def _plot_point_data(entity):
     axes[2].set_ylabel("Z Value")
 
     plt.tight_layout()
-    plt.show()
+    return fig
 
 def _plot_surf_data(entity):
     """Plot surface parameter data."""
+    import matplotlib.pyplot as plt
     params = entity.get('params', [])
 
-    plt.figure(figsize=(16, 10))
+    fig = plt.figure(figsize=(16, 10))
     plt.bar(range(len(params)), params, color='purple', alpha=0.7)
     plt.title(f"SURF Parameters: {entity['name']}")
     plt.xlabel("Parameter Index")
     plt.ylabel("Parameter Value")
-    plt.show()
+    return fig
 
 
 # --- FACE UV-plane plotting for debugging ---
 
-def _eval_monomial1(coeffs: List[float], order: int, u: float) -> float:
-    """Evaluate a 1D monomial series sum_{j=0..order-1} coeffs[j] * u^j."""
-    if order <= 0:
-        return 0.0
-    up = 1.0
-    acc = 0.0
-    for j in range(order):
-        if j == 0:
-            up = 1.0
-        elif j == 1:
-            up = u
-        else:
-            up *= u
-        acc += coeffs[j] * up
-    return acc
-
-def _sample_pcurve(pc: Optional[dict], samples_per_segment: int = 50) -> List[Tuple[float, float]]:
+def _sample_pcurve(pc: Optional[dict], samples_per_segment: int = 50) -> np.ndarray:
     """Sample a p-curve mapping (s(u), t(u)) across its segments, returning (s,t) points.
 
     pc layout (from fe.decode_cons_entity):
       {'n': n, 'pars': [...], 'segments': [ {'order':K, 'as': [...], 'at': [...], 't0': ..., 't1': ...}, ... ]}
+    Returns an (N,2) array (empty if there is no mapping).
     """
     if not pc or not pc.get('segments'):
-        return []
-    pts: List[Tuple[float, float]] = []
-    n = pc.get('n', 0)
-    for i, seg in enumerate(pc['segments']):
+        return np.empty((0, 2))
+    m = max(2, int(samples_per_segment))
+    us = np.arange(m) / float(m - 1)
+    zeros = np.zeros(m)
+    chunks = []
+    for seg in pc['segments']:
         K = int(seg.get('order', 0))
-        as_coeff = seg.get('as', [])
-        at_coeff = seg.get('at', [])
-        m = max(2, int(samples_per_segment))
-        for k in range(m):
-            u = k / float(m - 1)
-            s = _eval_monomial1(as_coeff, K, u)
-            t = _eval_monomial1(at_coeff, K, u)
-            # avoid duplicate at segment joints except for first
-            if i > 0 and k == 0 and pts:
-                continue
-            pts.append((s, t))
-    return pts
+        if K > 0:
+            s = npp.polyval(us, np.asarray(seg.get('as', [])[:K], dtype=float))
+            t = npp.polyval(us, np.asarray(seg.get('at', [])[:K], dtype=float))
+        else:
+            s = t = zeros
+        st = np.column_stack((s, t))
+        # avoid duplicate at segment joints except for first
+        chunks.append(st[1:] if chunks else st)
+    return np.concatenate(chunks)
+
+def _pcurve_eval_data(pc: dict) -> Optional[tuple]:
+    """Per-p-curve arrays for _eval_pcurve_at_ts, built once and kept on pc['_eval'].
+
+    Returns (pars[n+1], s_coeffs[n,Kmax], t_coeffs[n,Kmax]) or None if not evaluable.
+    """
+    data = pc.get('_eval')
+    if data is not None:
+        return data or None
+    pars = pc.get('pars')
+    segs = pc.get('segments')
+    n = len(segs) if segs else 0
+    if n == 0 or not pars or len(pars) < n + 1 or pars[-1] == pars[0]:
+        pc['_eval'] = ()
+        return None
+    kmax = max(1, max(int(seg.get('order', 0)) for seg in segs))
+    cs = np.zeros((n, kmax))
+    ct = np.zeros((n, kmax))
+    for i, seg in enumerate(segs):
+        K = max(0, int(seg.get('order', 0)))
+        as_coeff = seg.get('as', [])[:K]
+        at_coeff = seg.get('at', [])[:K]
+        cs[i, :len(as_coeff)] = as_coeff
+        ct[i, :len(at_coeff)] = at_coeff
+    data = (np.asarray(pars, dtype=float), cs, ct)
+    pc['_eval'] = data
+    return data
+
+def _eval_pcurve_at_ts(pc: Optional[dict], t_values) -> Optional[np.ndarray]:
+    """Evaluate the p-curve mapping at several curve parameters at once.
+
+    Same rules as _eval_pcurve_at_t; returns an (m,2) array of local (s,t) or None.
+    """
+    if not pc or not pc.get('segments') or not pc.get('pars'):
+        return None
+    data = _pcurve_eval_data(pc)
+    if data is None:
+        return None
+    pars, cs, ct = data
+    n = cs.shape[0]
+    # Clamp to [pars[0], pars[-1]]
+    t = np.minimum(np.maximum(np.asarray(t_values, dtype=float), pars[0]), pars[-1])
+    # Segment k: first with t <= pars[k+1] (last segment otherwise); binary
+    # search on the ascending breakpoints instead of an (m, n) comparison mask
+    k = np.minimum(np.searchsorted(pars[1:n + 1], t, side='left'), n - 1)
+    a = pars[k]
+    b = pars[k + 1]
+    span = b - a
+    u = np.divide(t - a, span, out=np.zeros_like(t), where=span != 0)
+    # Horner on the zero-padded coefficient rows of each point's segment
+    s_loc = np.zeros_like(u)
+    t_loc = np.zeros_like(u)
+    for j in range(cs.shape[1] - 1, -1, -1):
+        s_loc = s_loc * u + cs[k, j]
+        t_loc = t_loc * u + ct[k, j]
+    return np.column_stack((s_loc, t_loc))
 
 def _eval_pcurve_at_t(pc: Optional[dict], t_value: float) -> Optional[Tuple[float, float]]:
     """Evaluate p-curve mapping (s,t) at a given underlying curve parameter t_value.
@@ -447,57 +641,34 @@ def _eval_pcurve_at_t(pc: Optional[dict], t_value: float) -> Optional[Tuple[floa
     pc: {'n': n, 'pars': [t0..tn], 'segments': [{order, as, at, ...}, ...]}
     Returns (s_norm, t_norm) in local [0,1] space or None if not evaluable.
     """
-    if not pc or not pc.get('segments') or not pc.get('pars'):
+    st = _eval_pcurve_at_ts(pc, (t_value,))
+    if st is None:
         return None
-    pars = pc['pars']
-    segs = pc['segments']
-    n = len(segs)
-    if n == 0 or len(pars) < n + 1:
-        return None
-    # Clamp t_value to [pars[0], pars[-1]]
-    t0 = pars[0]
-    tN = pars[-1]
-    if tN == t0:
-        return None
-    t = min(max(t_value, t0), tN)
-    # Find segment index k such that pars[k] <= t <= pars[k+1]
-    k = 0
-    for i in range(n):
-        if t <= pars[i+1] or i == n - 1:
-            k = i
-            break
-    a = pars[k]
-    b = pars[k+1]
-    if b == a:
-        u = 0.0
-    else:
-        u = (t - a) / (b - a)
-    seg = segs[k]
-    K = int(seg.get('order', 0))
-    as_coeff = seg.get('as', [])
-    at_coeff = seg.get('at', [])
-    s_norm = _eval_monomial1(as_coeff, K, u)
-    t_norm = _eval_monomial1(at_coeff, K, u)
-    return (s_norm, t_norm)
-
-def plot_face_uv(model, idx, face_name: str, pcurve_samples: int = 50, show_local_midlines: bool = True):
+    return (float(st[0, 0]), float(st[0, 1]))
+
+def plot_face_uv(model, idx, face_name: str, pcurve_samples: int = 50, show_local_midlines: bool = True,
+                 show: bool = True):
     """Plot FACE items (CONS pcurves) in the surface parameter domain (s,t).
 
     - Draw global grid lines using SURF s_pars and t_pars (patch boundaries).
     - Optionally draw local midlines (u=0.5, v=0.5 within each patch) as hints.
     - Plot each CONS pcurve in (s,t) using its p-curve mapping (if present).
     - Mark FACE-provided (u,v) anchor points for each item.
+
+    Returns the figure; show=False skips plt.show().
     """
-    eface = idx['by_name'].get(face_name)
+    import matplotlib.pyplot as plt
+    by_name = idx['by_name']
+    eface = by_name.get(face_name)
     if not eface or eface.get('command') != 'FACE':
         raise KeyError(f"No such FACE: {face_name}")
 
-    f = fe.decode_face_entity(eface)
+    f = q.decode_cached(eface, fe.decode_face_entity)
     sref = f.get('surf')
-    esurf = q.get_entity(idx, sref)
+    esurf = by_name.get(sref)
     if not esurf:
         raise KeyError(f"FACE {face_name}: SURF {sref} not found")
-    surf = se.decode_surf_entity(esurf)
+    surf = q.decode_cached(esurf, se.decode_surf_entity)
 
     s_pars = surf.get('s_pars', [])
     t_pars = surf.get('t_pars', [])
@@ -511,22 +682,30 @@ def plot_face_uv(model, idx, face_name: str, pcurve_samples: int = 50, show_loca
 
     # Global grid (patch boundaries)
     if s_pars and t_pars:
-        for s in s_pars:
-            ax.plot([s, s], [tmin, tmax], color='lightgray', linewidth=1.0)
-        for t in t_pars:
-            ax.plot([smin, smax], [t, t], color='lightgray', linewidth=1.0)
+        ax.vlines(s_pars, tmin, tmax, colors='lightgray', linewidth=1.0)
+        ax.hlines(t_pars, smin, smax, colors='lightgray', linewidth=1.0)
 
         # Local midlines per patch (u=0.5 / v=0.5)
         if show_local_midlines:
-            for i in range(len(s_pars) - 1):
-                smid = 0.5 * (s_pars[i] + s_pars[i + 1])
-                ax.plot([smid, smid], [tmin, tmax], color='silver', linewidth=0.6, linestyle='--', alpha=0.7)
-            for j in range(len(t_pars) - 1):
-                tmid = 0.5 * (t_pars[j] + t_pars[j + 1])
-                ax.plot([smin, smax], [tmid, tmid], color='silver', linewidth=0.6, linestyle='--', alpha=0.7)
+            sp = np.asarray(s_pars, dtype=float)
+            tp = np.asarray(t_pars, dtype=float)
+            if len(sp) > 1:
+                ax.vlines(0.5 * (sp[:-1] + sp[1:]), tmin, tmax, colors='silver', linewidth=0.6,
+                          linestyles='--', alpha=0.7)
+            if len(tp) > 1:
+                ax.hlines(0.5 * (tp[:-1] + tp[1:]), smin, smax, colors='silver', linewidth=0.6,
+                          linestyles='--', alpha=0.7)
 
     # Color palette for loops/items
-    colors = ['tab:blue', 'tab:orange', 'tab:green', 'tab:red', 'tab:purple', 'tab:brown', 'tab:pink', 'tab:gray', 'tab:olive', 'tab:cyan']
+    colors = _LOOP_COLORS
+
+    # Marker points, batched per style: (color, markersize, alpha) -> [xs, ys]
+    markers = {}
+
+    def _mark(color, size, alpha, x, y):
+        xs_ys = markers.setdefault((color, size, alpha), ([], []))
+        xs_ys[0].append(x)
+        xs_ys[1].append(y)
 
     # Plot each loop's items
     loop_idx = 0
@@ -535,54 +714,49 @@ def plot_face_uv(model, idx, face_name: str, pcurve_samples: int = 50, show_loca
             cons_ref = item.get('cons')
             color = colors[(loop_idx + item_idx) % len(colors)]
             if cons_ref:
-                econs = q.get_entity(idx, cons_ref)
+                econs = by_name.get(cons_ref)
                 if econs:
-                    cons = fe.decode_cons_entity(econs)
+                    cons = q.decode_cached(econs, fe.decode_cons_entity)
                     pc = cons.get('pc')
                     pts = _sample_pcurve(pc, pcurve_samples)
                     # Deterministically map local [0,1] p-curve params to global SURF parameters
-                    if pts:
-                        xs = [smin + p[0] * (smax - smin) for p in pts]
-                        ys = [tmin + p[1] * (tmax - tmin) for p in pts]
+                    if len(pts):
+                        xs = smin + pts[:, 0] * (smax - smin)
+                        ys = tmin + pts[:, 1] * (tmax - tmin)
                         ax.plot(xs, ys, color=color, linewidth=1.8, alpha=0.95, label=f"{cons_ref}")
                     # Annotate underlying CURVE parameter ranges per p-curve segment
                     if pc and pc.get('pars') and pc.get('segments'):
                         pars = pc['pars']
-                        segs = pc['segments']
-                        for si in range(min(len(segs), len(pars) - 1)):
-                            ta = float(pars[si]); tb = float(pars[si + 1])
-                            st_a = _eval_pcurve_at_t(pc, ta)
-                            st_b = _eval_pcurve_at_t(pc, tb)
-                            tm = 0.5 * (ta + tb)
-                            st_m = _eval_pcurve_at_t(pc, tm)
-                            if st_a is not None:
-                                ax.plot([smin + st_a[0] * (smax - smin)], [tmin + st_a[1] * (tmax - tmin)],
-                                        marker='o', color=color, markersize=2, alpha=0.9)
-                            if st_b is not None:
-                                ax.plot([smin + st_b[0] * (smax - smin)], [tmin + st_b[1] * (tmax - tmin)],
-                                        marker='o', color=color, markersize=2, alpha=0.9)
-                            if st_m is not None:
-                                mx = smin + st_m[0] * (smax - smin)
-                                my = tmin + st_m[1] * (tmax - tmin)
-                                ax.text(mx, my, f" [{ta:.3g},{tb:.3g}]", fontsize=7, color=color,
-                                        va='bottom', ha='left', alpha=0.9)
+                        nseg = min(len(pc['segments']), len(pars) - 1)
+                        # Evaluate start, end and middle of every segment in one call
+                        tas = [float(pars[si]) for si in range(nseg)]
+                        tbs = [float(pars[si + 1]) for si in range(nseg)]
+                        tms = [0.5 * (ta + tb) for ta, tb in zip(tas, tbs)]
+                        st = _eval_pcurve_at_ts(pc, tas + tbs + tms) if nseg > 0 else None
+                        if st is not None:
+                            gx = smin + st[:, 0] * (smax - smin)
+                            gy = tmin + st[:, 1] * (tmax - tmin)
+                            for si in range(nseg):
+                                _mark(color, 2, 0.9, gx[si], gy[si])
+                                _mark(color, 2, 0.9, gx[nseg + si], gy[nseg + si])
+                                ax.text(gx[2 * nseg + si], gy[2 * nseg + si], f" [{tas[si]:.3g},{tbs[si]:.3g}]",
+                                        fontsize=7, color=color, va='bottom', ha='left', alpha=0.9)
                     # Plot FACE-provided endpoints as markers by evaluating p-curve at those curve parameters
                     if 'u' in item and 'v' in item:
-                        for t_val in (float(item['u']), float(item['v'])):
-                            st_local = _eval_pcurve_at_t(pc, t_val)
-                            if st_local is None:
-                                continue
-                            sx = smin + st_local[0] * (smax - smin)
-                            ty = tmin + st_local[1] * (tmax - tmin)
-                            ax.plot([sx], [ty], marker='o', color=color, markersize=3)
-                        # Label near the first endpoint
-                        st0 = _eval_pcurve_at_t(pc, float(item['u']))
-                        if st0 is not None:
-                            sx0 = smin + st0[0] * (smax - smin)
-                            ty0 = tmin + st0[1] * (tmax - tmin)
-                            ax.text(sx0, ty0, f" {cons_ref}", fontsize=8, color=color, va='bottom', ha='left')
+                        st = _eval_pcurve_at_ts(pc, (float(item['u']), float(item['v'])))
+                        if st is not None:
+                            gx = smin + st[:, 0] * (smax - smin)
+                            gy = tmin + st[:, 1] * (tmax - tmin)
+                            _mark(color, 3, None, gx[0], gy[0])
+                            _mark(color, 3, None, gx[1], gy[1])
+                            # Label near the first endpoint
+                            ax.text(gx[0], gy[0], f" {cons_ref}", fontsize=8, color=color, va='bottom', ha='left')
         loop_idx += 1
 
+    # One Line2D per marker style instead of one per point
+    for (color, size, alpha), (mxs, mys) in markers.items():
+        ax.plot(mxs, mys, linestyle='none', marker='o', color=color, markersize=size, alpha=alpha)
+
     # Fix axes to global parameter box
     ax.set_xlim(smin, smax)
     ax.set_ylim(tmin, tmax)
@@ -595,7 +769,9 @@ def plot_face_uv(model, idx, face_name: str, pcurve_samples: int = 50, show_loca
     if labels:
         by_label = dict(zip(labels, handles))
         ax.legend(by_label.values(), by_label.keys(), loc='best', fontsize=8)
-    plt.show()
+    if show:
+        plt.show()
+    return ax.figure
 
 
 def export_face_uv_loops(model, idx, face_name: str, out_dir: str, pcurve_samples: int = 50, eps: float = 1e-9) -> List[str]:
@@ -608,16 +784,17 @@ def export_face_uv_loops(model, idx, face_name: str, out_dir: str, pcurve_sample
 
     Returns list of written file paths.
     """
-    eface = idx['by_name'].get(face_name)
+    by_name = idx['by_name']
+    eface = by_name.get(face_name)
     if not eface or eface.get('command') != 'FACE':
         raise KeyError(f"No such FACE: {face_name}")
 
-    f = fe.decode_face_entity(eface)
+    f = q.decode_cached(eface, fe.decode_face_entity)
     sref = f.get('surf')
-    esurf = q.get_entity(idx, sref)
+    esurf = by_name.get(sref)
     if not esurf:
         raise KeyError(f"FACE {face_name}: SURF {sref} not found")
-    surf = se.decode_surf_entity(esurf)
+    surf = q.decode_cached(esurf, se.decode_surf_entity)
 
     s_pars = surf.get('s_pars', [])
     t_pars = surf.get('t_pars', [])
@@ -628,32 +805,36 @@ def export_face_uv_loops(model, idx, face_name: str, out_dir: str, pcurve_sample
 
     os.makedirs(out_dir, exist_ok=True)
 
+    scale = np.array([smax - smin, tmax - tmin])
+    offset = np.array([smin, tmin])
+
     written: List[str] = []
     loops = f.get('loops', []) or []
     for li, loop in enumerate(loops, start=1):
-        loop_pts: List[Tuple[float, float]] = []
+        chunks = []
         items = loop.get('items', []) or []
         for ci, item in enumerate(items):
             cons_ref = item.get('cons')
             if not cons_ref:
                 continue
-            econs = q.get_entity(idx, cons_ref)
+            econs = by_name.get(cons_ref)
             if not econs:
                 continue
             try:
-                cons = fe.decode_cons_entity(econs)
+                cons = q.decode_cached(econs, fe.decode_cons_entity)
             except Exception:
                 continue
             pc = cons.get('pc')
             pts_local = _sample_pcurve(pc, pcurve_samples)
-            if not pts_local:
+            if len(pts_local) == 0:
                 continue
             # Map to global SURF params
-            pts = [(smin + s * (smax - smin), tmin + t * (tmax - tmin)) for (s, t) in pts_local]
+            pts = pts_local * scale + offset
             # Skip first point for all but the first CONS in loop
-            if ci > 0 and len(pts) > 0:
+            if ci > 0:
                 pts = pts[1:]
-            loop_pts.extend(pts)
+            chunks.append(pts)
+        loop_pts = np.concatenate(chunks) if chunks else np.empty((0, 2))
 
         # Close-loop duplicate suppression: drop last if equals first (within eps)
         if len(loop_pts) >= 2:
@@ -661,7 +842,7 @@ def export_face_uv_loops(model, idx, face_name: str, out_dir: str, pcurve_sample
                 loop_pts = loop_pts[:-1]
 
         # Write CSV
-        if loop_pts:
+        if len(loop_pts):
             path = os.path.join(out_dir, f"{face_name}_loop{li}.csv")
             with open(path, 'w', encoding='utf-8', newline='') as fh:
                 fh.write(f"# FACE: {face_name}\n")
@@ -669,8 +850,7 @@ def export_face_uv_loops(model, idx, face_name: str, out_dir: str, pcurve_sample
                 fh.write(f"# loop: {li}\n")
                 fh.write(f"# points: {len(loop_pts)}\n")
                 fh.write("s,t\n")
-                for (sx, ty) in loop_pts:
-                    fh.write(f"{sx:.17g},{ty:.17g}\n")
+                np.savetxt(fh, loop_pts, fmt="%.17g", delimiter=",")
             written.append(path)
 
     return written
@@ -2,7 +2,25 @@
 
 def list_names_by_type(idx, entity_type):
     # entity_type in uppercase, e.g., "CURVE", "SURF", "POINT", "PSET", "MDI", etc.
-    return idx['by_type'].get(entity_type.upper(), [])
+    # Keys are always uppercase (the statement parser only accepts [A-Z]+), so
+    # try the given string as-is first and only upper() it on a miss.
+    by_type = idx['by_type']
+    names = by_type.get(entity_type)
+    if names is None:
+        names = by_type.get(entity_type.upper(), [])
+    return names
 
 def get_entity(idx, name):
     return idx['by_name'].get(name)
+
+def decode_cached(entity, decoder):
+    # Decode an entity once per decoder: results are stored on the entity dict
+    # itself ('_decoded', keyed by decoder), which model['entities'] and
+    # idx['by_name'] share, so any later caller (plot, print) reuses them.
+    # Entities are not edited after parsing.
+    cache = entity.setdefault('_decoded', {})
+    d = cache.get(decoder)
+    if d is None:
+        d = decoder(entity)
+        cache[decoder] = d
+    return d
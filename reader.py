@@ -15,12 +15,14 @@ _stmt_parse = re.compile(r'^\s*([A-Z][A-Z0-9]{0,7})\s*=\s*([A-Z]+)\s*(?:/\s*(.*)
 def _is_comment(s):
     return s.lstrip().startswith('$$')
 
-def _iter_records(path):
+def _read_lines(path):
+    # One read() and split instead of iterating the text file line by line;
+    # newline translation is the same (universal newlines in text mode)
     with open(path, 'r', encoding='latin-1') as f:
-        for i, raw in enumerate(f, start=1):
-            if raw.endswith('\n'):
-                raw = raw[:-1]
-            yield i, raw
+        lines = f.read().split('\n')
+    if lines[-1] == '':
+        lines.pop()  # trailing newline (or empty file)
+    return lines
 
 def _coalesce_statements(records):
     buf = []
@@ -36,6 +38,7 @@ def _coalesce_statements(records):
             return out
         return None
 
+    lineno = 0
     for lineno, raw in records:
         data = raw[:72]  # only data columns
         # Stop coalescing when encountering END (standalone terminator)
@@ -61,47 +64,44 @@ def _coalesce_statements(records):
             buf.append(data)
 
     if buf:
-        flushed = flush(records[-1][0] if records else 0)
+        flushed = flush(lineno)
         if flushed:
             yield flushed
 
-def _to_number(tok):
-    t = tok.strip()
-    if t == '':
-        return t
-    if re.match(r'^[\+\-]?\d+$', t):
-        try:
-            return int(t)
-        except:
-            pass
-    try:
-        return float(t)
-    except:
-        return t
-
 def _split_params(s):
     if s is None or s.strip() == '':
         return []
-    parts = [p.strip() for p in s.split(',')]
+    # Each token: int if it is (optionally signed) decimal digits, else float,
+    # else kept as a string. References like SR85, CV57 need no separate test:
+    # float() rejects them, so they stay strings.
     out = []
-    for p in parts:
-        if p == '':
+    append = out.append
+    for p in s.split(','):
+        p = p.strip()
+        if not p:
             continue
-        # Keep references like SR85, CV57 as strings; numbers to numeric
-        if re.match(r'^[A-Z]{2}\d+$', p):
-            out.append(p)
-        else:
-            out.append(_to_number(p))
+        if (p[1:] if p[0] in '+-' else p).isdecimal():
+            try:
+                append(int(p))
+                continue
+            except ValueError:
+                pass
+        try:
+            append(float(p))
+        except ValueError:
+            append(p)
     return out
 
 def read_vdafs(path):
-    recs = list(_iter_records(path))
-    ln_to_text = {ln: tx for ln, tx in recs}
+    # Statements are coalesced lazily from the line list (no per-record
+    # tuples are kept); HEADER reads its raw lines back by index: line ln
+    # is texts[ln - 1]
+    texts = _read_lines(path)
 
     header = None
     entities = []
 
-    for ln0, ln1, text in _coalesce_statements(recs):
+    for ln0, ln1, text in _coalesce_statements(enumerate(texts, start=1)):
         m = _stmt_parse.match(text)
         if not m:
             continue
@@ -122,7 +122,7 @@ def read_vdafs(path):
             ln0_int = ln0 if isinstance(ln0, int) else int(ln0 or 0)
             ln = ln0_int + 1
             for _ in range(max(0, n)):
-                lines.append(ln_to_text.get(ln, ''))
+                lines.append(texts[ln - 1] if ln <= len(texts) else '')
                 ln += 1
             header = {
                 'name': name,
@@ -18,6 +18,9 @@
 # We do not merge seams (verts are duplicated along patch boundaries — fine for viewing).
 
 import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import curve_eval as ce
 
 def _as_int(x):
     if isinstance(x, int):
@@ -27,38 +30,72 @@ def _as_int(x):
     except Exception:
         raise ValueError("Expected integer-like value, got: %r" % (x,))
 
-def _as_float(x):
-    if isinstance(x, (int, float)):
-        return float(x)
-    try:
-        return float(str(x))
-    except Exception:
-        raise ValueError("Expected float-like value, got: %r" % (x,))
+# Point evaluators per patch order (jor, kor), generated on first use.
+_PATCH_EVALUATORS = {}
+
+def _patch_evaluator(jor, kor):
+    # Return f(ax, ay, az, u, v) -> (x, y, z) specialised for (jor, kor).
+    # The generated body unpacks the coefficients into locals and spells out
+    # the nested Horner expression: each row j is a polynomial in v, the rows
+    # are combined as a polynomial in u (see curve_eval._segment_sampler).
+    f = _PATCH_EVALUATORS.get((jor, kor))
+    if f is None:
+        def horner(names, t):
+            expr = names[-1]
+            for n in reversed(names[:-1]):
+                expr = f"({expr})*{t} + {n}"
+            return expr
+
+        def horner2(c):
+            rows = [horner([f"{c}{j*kor + k}" for k in range(kor)], 'v') for j in range(jor)]
+            return horner([f"({r})" for r in rows], 'u')
+
+        def unpack(c, name):
+            return ", ".join(f"{c}{i}" for i in range(jor * kor)) + f", = {name}"
+
+        src = (
+            "def _eval(ax, ay, az, u, v):\n"
+            f"    {unpack('x', 'ax')}\n"
+            f"    {unpack('y', 'ay')}\n"
+            f"    {unpack('z', 'az')}\n"
+            f"    return ({horner2('x')}, {horner2('y')}, {horner2('z')})\n"
+        )
+        ns = {}
+        exec(compile(src, f"<surf_eval evaluator {jor}x{kor}>", "exec"), ns)
+        f = _PATCH_EVALUATORS[(jor, kor)] = ns['_eval']
+    return f
 
 def _eval_monomial2(ax, ay, az, jor, kor, u, v):
     # Evaluate monomial surface at (u,v)
     # coeff layout is row-major in j (s-power), then k (t-power):
     # idx = j*kor + k
-    # Use simple power products; Horner could optimize but clarity first.
-    # Precompute powers
-    up = [1.0]
-    for _ in range(1, jor):
-        up.append(up[-1] * u)
-    vp = [1.0]
-    for _ in range(1, kor):
-        vp.append(vp[-1] * v)
-
-    x = y = z = 0.0
-    idx = 0
-    for j in range(jor):
-        uj = up[j]
-        for k in range(kor):
-            w = uj * vp[k]
-            x += ax[idx] * w
-            y += ay[idx] * w
-            z += az[idx] * w
-            idx += 1
-    return (x, y, z)
+    # Nested Horner (no power tables), unrolled per order by _patch_evaluator
+    return _patch_evaluator(jor, kor)(ax, ay, az, u, v)
+
+def _iso_coeffs(ax, ay, az, jor, kor, u=None, v=None):
+    # Collapse a patch to 1D monomial coefficients along an iso-line.
+    # With v fixed: c[j] = sum_k a[j*kor+k] * v^k  (powers of u, length jor)
+    # With u fixed: c[k] = sum_j a[j*kor+k] * u^j  (powers of v, length kor)
+    # Sampling the iso-line then only needs a 1D Horner per point.
+    if (u is None) == (v is None):
+        raise ValueError("Exactly one of u, v must be given")
+    out = []
+    for a in (ax, ay, az):
+        c = []
+        if v is not None:
+            for j in range(jor):
+                s = 0.0
+                for k in range(kor - 1, -1, -1):
+                    s = s * v + a[j*kor + k]
+                c.append(s)
+        else:
+            for k in range(kor):
+                s = 0.0
+                for j in range(jor - 1, -1, -1):
+                    s = s * u + a[j*kor + k]
+                c.append(s)
+        out.append(c)
+    return tuple(out)
 
 def _decode_surface_params(params):
     if not params or len(params) < 2:
@@ -73,10 +110,14 @@ def _decode_surface_params(params):
     if len(params) < i + (nps + 1) + (npt + 1):
         raise ValueError("SURF: missing global parameter vectors")
 
-    s_pars = [ _as_float(params[i + k]) for k in range(nps + 1) ]
-    i += (nps + 1)
-    t_pars = [ _as_float(params[i + k]) for k in range(npt + 1) ]
-    i += (npt + 1)
+    # knot vectors become floats here, once; patches and evaluators reuse them
+    try:
+        s_pars = [float(c) for c in params[i:i + nps + 1]]
+        i += (nps + 1)
+        t_pars = [float(c) for c in params[i:i + npt + 1]]
+        i += (npt + 1)
+    except (TypeError, ValueError):
+        raise ValueError("SURF: non-numeric global parameter")
 
     patches = []
     total_patches = nps * npt
@@ -105,9 +146,15 @@ def _decode_surface_params(params):
         if i + 3*need > len(params):
             raise ValueError("SURF: not enough coefficients for patch %d" % count)
 
-        ax = [ _as_float(params[i + k])       for k in range(need) ]
-        ay = [ _as_float(params[i + need + k]) for k in range(need) ]
-        az = [ _as_float(params[i + 2*need + k]) for k in range(need) ]
+        # convert the patch's x|y|z block in one pass, then slice it per channel;
+        # float() of a parsed token doubles as the "all numbers?" check
+        try:
+            block = [float(c) for c in params[i:i + 3*need]]
+        except (TypeError, ValueError):
+            raise ValueError("SURF: non-numeric coefficient in patch %d" % count)
+        ax = block[:need]
+        ay = block[need:2*need]
+        az = block[2*need:]
         i += 3*need
 
         # map to s,t intervals (s-major listing: ps fastest or pt fastest varies by export;
@@ -120,8 +167,8 @@ def _decode_surface_params(params):
         patches.append({
             'jor': jor, 'kor': kor,
             'ax': ax, 'ay': ay, 'az': az,
-            's0': _as_float(s0), 's1': _as_float(s1),
-            't0': _as_float(t0), 't1': _as_float(t1),
+            's0': s0, 's1': s1,
+            't0': t0, 't1': t1,
         })
         count += 1
 
@@ -140,11 +187,32 @@ def decode_surface_entity(entity):
 def decode_surf_entity(entity):
     return decode_surface_entity(entity)
 
-def sample_surface(surface, nu=40, nv=40, include_seams=True):
+def _sample_patch_verts(p, us, vs, skip):
+    """Grid vertices of one patch, row by row; skip drops the first row and column."""
+    jor, kor = p['jor'], p['kor']
+    ax, ay, az = p['ax'], p['ay'], p['az']
+    row_vs = vs[1:] if skip else vs
+
+    # build grid of (u_i, v_j): the u-dependence is folded into 1D
+    # coefficients once per row, then the row's v samples go through
+    # curve_eval's sampler for order kor (generated once per order and
+    # shared by all patches and rows)
+    sample_row = ce._segment_sampler(kor)
+    verts = []
+    for i, u in enumerate(us):
+        if i == 0 and skip:
+            continue
+        cx, cy, cz = _iso_coeffs(ax, ay, az, jor, kor, u=u)
+        verts.extend(sample_row(cx, cy, cz, row_vs))
+    return verts
+
+def sample_surface(surface, nu=40, nv=40, include_seams=True, workers=1):
     """
     Sample each patch on an (nu x nv) grid in local (u,v) ∈ [0,1].
     Returns (vertices Nx3 list, faces Mx3 int list).
     Seams are NOT merged (duplicate vertices along boundaries) — simple & robust.
+    Patches are independent: with workers > 1 their vertices are sampled in
+    that many processes (pure Python holds the GIL); the result is the same.
     """
     verts = []
     faces = []
@@ -152,41 +220,45 @@ def sample_surface(surface, nu=40, nv=40, include_seams=True):
     nu = max(2, int(nu))
     nv = max(2, int(nv))
 
-    vidx_offset = 0
-    for p in surface['patches']:
-        jor, kor = p['jor'], p['kor']
-        ax, ay, az = p['ax'], p['ay'], p['az']
-
-        # build grid of (u_i, v_j)
-        for i in range(nu + 1):
-            # avoid duplicating seam if requested
-            if i == 0 and not include_seams and vidx_offset > 0:
-                continue
-            u = i / float(nu)
-            for j in range(nv + 1):
-                if j == 0 and not include_seams and vidx_offset > 0:
-                    continue
-                v = j / float(nv)
-                x, y, z = _eval_monomial2(ax, ay, az, jor, kor, u, v)
-                verts.append((x, y, z))
-
-        # local counts (accounting for seam skipping is messy; keep simple path)
-        cols = nv + 1
-        rows = nu + 1
-        # create two triangles per cell
-        for i in range(nu):
-            for j in range(nv):
-                a = vidx_offset + i*cols + j
-                b = a + 1
-                c = a + cols
-                d = c + 1
-                faces.append((a, b, d))
-                faces.append((a, d, c))
-
-        vidx_offset += rows * cols
+    us = [i / float(nu) for i in range(nu + 1)]
+    vs = [j / float(nv) for j in range(nv + 1)]
+
+    # local counts (accounting for seam skipping is messy; keep simple path)
+    cols = nv + 1
+    rows = nu + 1
+    # two triangles per cell; the connectivity is the same for every patch,
+    # so build it once and only shift it by each patch's vertex offset
+    cell_faces = []
+    for i in range(nu):
+        for j in range(nv):
+            a = i*cols + j
+            b = a + 1
+            c = a + cols
+            d = c + 1
+            cell_faces.append((a, b, d))
+            cell_faces.append((a, d, c))
+
+    patches = surface['patches']
+    # avoid duplicating seam if requested (every patch after the first)
+    skips = [not include_seams and k > 0 for k in range(len(patches))]
+    if workers > 1 and len(patches) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            chunk = max(1, len(patches) // (4 * workers))
+            for block in ex.map(_sample_patch_verts, patches, repeat(us), repeat(vs), skips,
+                                chunksize=chunk):
+                verts.extend(block)
+    else:
+        for block in map(_sample_patch_verts, patches, repeat(us), repeat(vs), skips):
+            verts.extend(block)
+
+    faces.extend(cell_faces)
+    for k in range(1, len(patches)):
+        o = k * rows * cols
+        faces.extend([(a + o, b + o, c + o) for a, b, c in cell_faces])
 
     return verts, faces
 
 # alias
-def sample_surf(surface, nu=40, nv=40, include_seams=True):
-    return sample_surface(surface, nu, nv, include_seams)
+def sample_surf(surface, nu=40, nv=40, include_seams=True, workers=1):
+    return sample_surface(surface, nu, nv, include_seams, workers)
+
@@ -1,23 +1,35 @@
 import os
 import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import reader
 import index
+import curve_eval as ce
 import surf_eval as se
 
 # Continuity checker for SURF seams
-# Usage: python -m tools.check_surf_continuity [path_to_vda]
+# Usage: python -m tools.check_surf_continuity [path_to_vda] [--workers N]
 
 EXAMPLE_PATH = os.path.join('examples', 'SURF_FLAE0001.vda')
 
-def norm3(a, b):
-    return math.sqrt((a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2)
+def edge_coeffs(p, uu=None, vv=None):
+    # 1D coefficients of the patch iso-line at fixed uu or vv (see se._iso_coeffs)
+    return se._iso_coeffs(p['ax'], p['ay'], p['az'], p['jor'], p['kor'], u=uu, v=vv)
 
-def eval_patch_point(p, uu, vv):
-    # p is a monomial patch dict with keys: ax, ay, az, jor, kor
-    x, y, z = se._eval_monomial2(p['ax'], p['ay'], p['az'], p['jor'], p['kor'], uu, vv)
-    return (x, y, z)
+def seam_sq_stats(ea, eb, params):
+    # Max and sum of squared distances between two edges (1D coefficients from
+    # edge_coeffs) over params.
+    # Works on the difference polynomial, sampled in one call of curve_eval's
+    # generated sampler for its order (unrolled Horner for x/y/z per sample).
+    n = max(len(ea[0]), len(eb[0]))
+    dx, dy, dz = (
+        [(ca[i] if i < len(ca) else 0.0) - (cb[i] if i < len(cb) else 0.0) for i in range(n)]
+        for ca, cb in zip(ea, eb)
+    )
+    d2 = [x*x + y*y + z*z for x, y, z in ce._segment_sampler(n)(dx, dy, dz, params)]
+    return max(d2, default=0.0), sum(d2)
 
-def check_surf(path):
+def check_surf(path, workers=1):
     model = reader.read_vdafs(path)
     idx = index.build_index(model)
     # find first SURF
@@ -34,42 +46,46 @@ def check_surf(path):
     print(f'SURF {surf_name}: nps={nps}, npt={npt}, patches={len(patches)}')
 
     # Build grid of patches by (ps, pt) from enumeration order
-    grid = {}
-    for idx_p, p in enumerate(patches):
-        ps = idx_p // npt
-        pt = idx_p % npt
-        grid[(ps, pt)] = p
+    grid = [patches[ps*npt:(ps+1)*npt] for ps in range(nps)]
 
-    samples = 101
-    # Check seams along v (between v_idx and v_idx+1 at constant u_idx)
+    # Collect both seam families first: (label, edge A, edge B), each edge
+    # collapsed to a 1D polynomial in the parameter running along the seam
+    seams = []
+    # Seams along v (between v_idx and v_idx+1 at constant u_idx)
     for ps in range(nps):
         for pt in range(npt-1):
-            pL = grid[(ps, pt)]
-            pR = grid[(ps, pt+1)]
-            errs = []
-            for k in range(samples):
-                uu = k/(samples-1)
-                a = eval_patch_point(pL, uu, 1.0)  # right edge of left patch
-                b = eval_patch_point(pR, uu, 0.0)  # left edge of right patch
-                errs.append(norm3(a,b))
-            print(f' seam (ps={ps}, pt={pt}|{pt+1}) max={max(errs):.6g} mean={sum(errs)/len(errs):.6g}')
-
-    # Check seams along u (between u_idx and u_idx+1 at constant v_idx)
+            seams.append((f'ps={ps}, pt={pt}|{pt+1}',
+                          edge_coeffs(grid[ps][pt], vv=1.0),     # right edge of left patch
+                          edge_coeffs(grid[ps][pt+1], vv=0.0)))  # left edge of right patch
+    # Seams along u (between u_idx and u_idx+1 at constant v_idx)
     for pt in range(npt):
         for ps in range(nps-1):
-            pB = grid[(ps, pt)]
-            pT = grid[(ps+1, pt)]
-            errs = []
-            for k in range(samples):
-                vv = k/(samples-1)
-                a = eval_patch_point(pB, 1.0, vv)  # top edge of bottom patch
-                b = eval_patch_point(pT, 0.0, vv)  # bottom edge of top patch
-                errs.append(norm3(a,b))
-            print(f' seam (pt={pt}, ps={ps}|{ps+1}) max={max(errs):.6g} mean={sum(errs)/len(errs):.6g}')
+            seams.append((f'pt={pt}, ps={ps}|{ps+1}',
+                          edge_coeffs(grid[ps][pt], uu=1.0),     # top edge of bottom patch
+                          edge_coeffs(grid[ps+1][pt], uu=0.0)))  # bottom edge of top patch
+
+    # Then sample all seams in a single pass; seams are independent, so large
+    # SURFs can spread them over worker processes (pure Python holds the GIL)
+    samples = 101
+    params = [k/(samples-1) for k in range(samples)]
+    labels = [sm[0] for sm in seams]
+    eas = [sm[1] for sm in seams]
+    ebs = [sm[2] for sm in seams]
+    if workers > 1 and len(seams) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            chunk = max(1, len(seams) // (4 * workers))
+            stats = list(ex.map(seam_sq_stats, eas, ebs, repeat(params), chunksize=chunk))
+    else:
+        stats = list(map(seam_sq_stats, eas, ebs, repeat(params)))
+    for label, (d2max, d2sum) in zip(labels, stats):
+        print(f' seam ({label}) max={math.sqrt(d2max):.6g} rms={math.sqrt(d2sum/samples):.6g}')
 
     return 0
 
 if __name__ == '__main__':
-    import sys
-    path = sys.argv[1] if len(sys.argv) > 1 else EXAMPLE_PATH
-    raise SystemExit(check_surf(path))
+    import argparse
+    ap = argparse.ArgumentParser(description="Check SURF patch seams for gaps")
+    ap.add_argument('path', nargs='?', default=EXAMPLE_PATH, help='Path to .vda file')
+    ap.add_argument('--workers', type=int, default=1, help='Worker processes for the seam sampling (default: 1)')
+    args = ap.parse_args()
+    raise SystemExit(check_surf(args.path, workers=args.workers))
@@ -1,6 +1,7 @@
 # Print entity data to terminal (order, parameters, coefficients etc.)
 import curve_eval as ce
 import surf_eval as se
+import query as q
 
 def print_entity_data(model, idx, name):
     """Print the raw data/parameters of an entity to the terminal."""
@@ -14,7 +15,7 @@ def print_entity_data(model, idx, name):
     print()
 
     if cmd == 'CURVE':
-        curve = ce.decode_curve_entity(e)
+        curve = q.decode_cached(e, ce.decode_curve_entity)
         _print_curve_data(curve, name)
         return
 
@@ -24,7 +25,7 @@ def print_entity_data(model, idx, name):
 
     if cmd == 'SURF':
         try:
-            surf = se.decode_surf_entity(e)
+            surf = q.decode_cached(e, se.decode_surf_entity)
             _print_surf_data(surf, name)
         except Exception as ex:
             print(f"Error decoding SURF: {ex}")
@@ -70,34 +71,29 @@ def _print_point_data(entity):
         print(f"Point {i+1}: ({x}, {y}, {z})")
 
 def _print_surf_data(surf, name):
-    """Print decoded SURF patch data."""
+    """Print decoded SURF patch data (layout of se.decode_surf_entity)."""
+    npt = surf['npt']
     print("=== SURF DETAILS ===")
-    print(f"Number of patches: {surf['nu']} x {surf['nv']} (u x v)")
-    print(f"U parameters: {surf['u_pars']}")
-    print(f"V parameters: {surf['v_pars']}")
+    print(f"Number of patches: {surf['nps']} x {npt} (s x t)")
+    print(f"S parameters: {surf['s_pars']}")
+    print(f"T parameters: {surf['t_pars']}")
     print()
 
     for i, patch in enumerate(surf['patches']):
-        print(f"--- Patch {i+1} (u_idx={patch['u_idx']}, v_idx={patch['v_idx']}) ---")
-        print(f"Orders: {patch['order_u']} x {patch['order_v']} (u x v)")
-        print(f"U parameter range: [{patch['u0']}, {patch['u1']}]")
-        print(f"V parameter range: [{patch['v0']}, {patch['v1']}]")
+        jor, kor = patch['jor'], patch['kor']
+        print(f"--- Patch {i+1} (s_idx={i // npt}, t_idx={i % npt}) ---")
+        print(f"Orders: {jor} x {kor} (s x t)")
+        print(f"S parameter range: [{patch['s0']}, {patch['s1']}]")
+        print(f"T parameter range: [{patch['t0']}, {patch['t1']}]")
         print()
 
-        print("X coefficients:")
-        for u_idx, row in enumerate(patch['coeffs_x']):
-            print(f"  u^{u_idx}: {row}")
-        print()
-
-        print("Y coefficients:")
-        for u_idx, row in enumerate(patch['coeffs_y']):
-            print(f"  u^{u_idx}: {row}")
-        print()
-
-        print("Z coefficients:")
-        for u_idx, row in enumerate(patch['coeffs_z']):
-            print(f"  u^{u_idx}: {row}")
-        print()
+        # flat coefficients are row-major in the s-power: a[j*kor + k]
+        for label, key in (("X", 'ax'), ("Y", 'ay'), ("Z", 'az')):
+            coeffs = patch[key]
+            print(f"{label} coefficients:")
+            for j in range(jor):
+                print(f"  u^{j}: {coeffs[j*kor:(j+1)*kor]}")
+            print()
 
 def _print_surf_data_raw(entity):
     """Print raw SURF parameter data when decoding fails."""
@@ -3,6 +3,7 @@ import math
 import reader
 import index
 import surf_eval as se
+from tools.check_surf_continuity import seam_sq_stats
 
 # Try multiple evaluation variants to diagnose SURF encoding mismatches.
 # Run: python -m tools.diagnose_surf_encoding [examples/SURF_FLAE0001.vda]
@@ -10,33 +11,11 @@ import surf_eval as se
 EXAMPLE_PATH = os.path.join('examples', 'SURF_FLAE0001.vda')
 
 
-def norm3(a, b):
-    return math.sqrt((a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2)
-
-
-def eval_poly2d(coeffs, u, v, transpose=False):
-    # Fallback: evaluate coeffs as monomial matrix when not using se._eval_monomial2 directly
-    Ku = len(coeffs)
-    Kv = len(coeffs[0]) if Ku > 0 else 0
-    up = [1.0]
-    for _ in range(1, Ku):
-        up.append(up[-1] * u)
-    vp = [1.0]
-    for _ in range(1, Kv):
-        vp.append(vp[-1] * v)
-    s = 0.0
-    for i in range(Ku):
-        for j in range(Kv):
-            s += coeffs[i][j] * up[i] * vp[j]
-    return s
-
-
-def eval_patch_point_variant(p, uu, vv, *, transpose=False, flip_v=False):
+def edge_coeffs_variant(p, vv, *, transpose=False, flip_v=False):
+    # Edge at constant vv collapsed to 1D coefficients in u (see se._iso_coeffs)
     if flip_v:
         vv = 1.0 - vv
-    # Our current representation is monomial with flat arrays; transpose not applicable here
-    x, y, z = se._eval_monomial2(p['ax'], p['ay'], p['az'], p['jor'], p['kor'], uu, vv)
-    return (x, y, z)
+    return se._iso_coeffs(p['ax'], p['ay'], p['az'], p['jor'], p['kor'], v=vv)
 
 
 def check_surf_variants(path):
@@ -53,14 +32,10 @@ def check_surf_variants(path):
     patches = surf['patches']
     nps = surf['nps']
     npt = surf['npt']
-    grid = {}
-    for idx_p, p in enumerate(patches):
-        ps = idx_p // npt
-        pt = idx_p % npt
-        grid[(ps, pt)] = p
+    grid = [patches[ps*npt:(ps+1)*npt] for ps in range(nps)]
 
-    pL = grid.get((0, 0))
-    pR = grid.get((0, 1))
+    pL = grid[0][0] if grid and len(grid[0]) > 0 else None
+    pR = grid[0][1] if grid and len(grid[0]) > 1 else None
     if not pL or not pR:
         print('Expected (ps,pt)=(0,0) and (0,1) patches not found')
         return
@@ -71,14 +46,12 @@ def check_surf_variants(path):
     ]
 
     samples = 101
+    params = [k/(samples-1) for k in range(samples)]
     for name, opts in variants:
-        errs = []
-        for k in range(samples):
-            uu = k/(samples-1)
-            a = eval_patch_point_variant(pL, uu, 1.0, **opts)
-            b = eval_patch_point_variant(pR, uu, 0.0, **opts)
-            errs.append(norm3(a, b))
-        print(f'{name:>12}: seam max={max(errs):.6g} mean={sum(errs)/len(errs):.6g}')
+        eL = edge_coeffs_variant(pL, 1.0, **opts)
+        eR = edge_coeffs_variant(pR, 0.0, **opts)
+        d2max, d2sum = seam_sq_stats(eL, eR, params)
+        print(f'{name:>12}: seam max={math.sqrt(d2max):.6g} rms={math.sqrt(d2sum/samples):.6g}')
 
 
 if __name__ == '__main__':
@@ -16,22 +16,28 @@ import os
 from typing import Dict, List, Set
 
 import face_eval as fe
+import query as q
 
 
-def _collect_face_deps(model: Dict, idx: Dict, face_name: str) -> List[str]:
+def _collect_face_deps(model: Dict, idx: Dict, face_name: str) -> Dict[str, List[str]]:
+    """Names a FACE depends on (itself included), bucketed by command
+    (CURVE, SURF, CONS, FACE) in discovery order."""
     by_name = idx['by_name']
     face = by_name.get(face_name)
     if not face or face.get('command') != 'FACE':
         raise KeyError(f"FACE not found: {face_name}")
 
-    f = fe.decode_face_entity(face)
-    needed: List[str] = []
+    # decodes are cached on the entities, so FACEs sharing CONS decode them once
+    f = q.decode_cached(face, fe.decode_face_entity)
+    buckets: Dict[str, List[str]] = {cmd: [] for cmd in essential_order}
     seen: Set[str] = set()
 
     def add(nm: str):
         if nm and nm not in seen:
             seen.add(nm)
-            needed.append(nm)
+            cmd = (by_name.get(nm) or {}).get('command')
+            if cmd in buckets:
+                buckets[cmd].append(nm)
 
     # SURF first
     add(f['surf'])
@@ -42,13 +48,13 @@ def _collect_face_deps(model: Dict, idx: Dict, face_name: str) -> List[str]:
             add(cn)
             ecn = by_name.get(cn)
             if ecn and ecn.get('command') == 'CONS':
-                d = fe.decode_cons_entity(ecn)
+                d = q.decode_cached(ecn, fe.decode_cons_entity)
                 cv = d.get('curve')
                 if isinstance(cv, str):
                     add(cv)
     # FACE last
     add(face_name)
-    return needed
+    return buckets
 
 
 essential_order = ('CURVE', 'SURF', 'CONS', 'FACE')
@@ -64,22 +70,16 @@ def write_face_file(model: Dict, idx: Dict, face_name: str, out_path: str) -> No
         hname = header.get('name', 'HD')
         n = int(header.get('n_lines') or 0)
         lines.append(f"{hname} = HEADER / {n}")
-        for ln in header.get('lines', [])[:n]:
-            lines.append(ln)
+        lines.extend(header.get('lines', [])[:n])
 
-    # Group dependencies in desired order: CURVE, SURF, CONS, FACE
+    # Dependencies in desired order: CURVE, SURF, CONS, FACE
     by_name = idx['by_name']
-
-    def _names_by_cmd(cmd: str) -> List[str]:
-        return [nm for nm in deps if (by_name.get(nm) or {}).get('command') == cmd]
-
     ordered: List[str] = []
     for cmd in essential_order:
         if cmd == 'FACE':
-            if face_name in deps:
-                ordered.append(face_name)
+            ordered.append(face_name)
         else:
-            ordered.extend(sorted(_names_by_cmd(cmd)))
+            ordered.extend(sorted(deps[cmd]))
 
     for nm in ordered:
         e = by_name.get(nm)
@@ -93,12 +93,10 @@ def write_face_file(model: Dict, idx: Dict, face_name: str, out_path: str) -> No
 
     lines.append('END')
 
+    # No line carries its own newline (the reader splits them off, _wrap_72
+    # strips them), so the file is written in one go
     with open(out_path, 'w', encoding='latin-1') as f:
-        for ln in lines:
-            if not ln.endswith('\n'):
-                f.write(ln + '\n')
-            else:
-                f.write(ln)
+        f.write('\n'.join(lines) + '\n')
 
 
 def _wrap_72(text: str) -> List[str]:
@@ -106,10 +104,4 @@ def _wrap_72(text: str) -> List[str]:
     Columns 73.. are omitted (reader ignores them anyway).
     """
     s = text.rstrip('\n')
-    out: List[str] = []
-    while s:
-        out.append(s[:72])
-        s = s[72:]
-    if not out:
-        out = ['']
-    return out
+    return [s[i:i + 72] for i in range(0, len(s), 72)] or ['']
@@ -16,15 +16,38 @@ Each file will be drawn in a different color with its file name as legend label.
 from __future__ import annotations
 
 import argparse
+import array
 import glob
 import os
-from typing import List, Tuple
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
 import matplotlib.pyplot as plt
-
-
-def read_st_csv(path: str) -> List[Tuple[float, float]]:
-    pts: List[Tuple[float, float]] = []
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+
+def read_st_csv(path: str) -> np.ndarray:
+    """Return the (s, t) rows of a loop CSV as an (N, 2) float array.
+
+    Exported files (comment lines, the 's,t' header, "<s>,<t>" rows) are
+    parsed in one np.loadtxt call; anything else (whitespace-separated,
+    stray text lines) goes through the lenient line-by-line reader.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)  # empty file
+            return np.loadtxt(path, delimiter=',', comments=('#', 's,t', 's;t'),
+                              usecols=(0, 1), ndmin=2, encoding='utf-8')
+    except ValueError:
+        return _read_st_csv_lenient(path)
+
+
+def _read_st_csv_lenient(path: str) -> np.ndarray:
+    # s, t interleaved as C doubles (no tuple per point), viewed as (N, 2)
+    pts = array.array('d')
     with open(path, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.strip()
@@ -45,8 +68,9 @@ def read_st_csv(path: str) -> List[Tuple[float, float]]:
                 t = float(parts[1])
             except ValueError:
                 continue
-            pts.append((s, t))
-    return pts
+            pts.append(s)
+            pts.append(t)
+    return np.frombuffer(pts, dtype=np.float64).reshape(-1, 2)
 
 
 def plot_files(files: List[str], title: str | None, save: str | None, show: bool, linewidth: float, legend: bool, dpi: int, equal_aspect: bool, markers: bool, marker_size: float) -> None:
@@ -69,30 +93,38 @@ def plot_files(files: List[str], title: str | None, save: str | None, show: bool
     plt.figure(figsize=(9, 7), dpi=dpi)
     ax = plt.gca()
 
-    any_plotted = False
-    all_x: List[float] = []
-    all_y: List[float] = []
+    # Collect every loop first, then draw them as one LineCollection (markers,
+    # if requested, as one scatter) with proxy legend entries per file
+    all_pts: List[np.ndarray] = []
+    colors: List[str] = []
+    handles: List[Line2D] = []
+
+    # Read the files on a thread pool so I/O of many loop files overlaps;
+    # map() yields in input order, keeping the file -> color assignment
+    with ThreadPoolExecutor(max_workers=min(32, len(expanded))) as ex:
+        loaded = list(ex.map(read_st_csv, expanded))
 
-    for i, path in enumerate(expanded):
-        pts = read_st_csv(path)
-        if not pts:
+    for i, (path, pts) in enumerate(zip(expanded, loaded)):
+        if not len(pts):
             print(f"[warn] Empty or unreadable CSV: {path}")
             continue
-        xs = [p[0] for p in pts]
-        ys = [p[1] for p in pts]
         color = palette[i % len(palette)]
         label = os.path.basename(path)
-        if markers:
-            ax.plot(xs, ys, color=color, linewidth=linewidth, label=label, marker='o', markersize=marker_size)
-        else:
-            ax.plot(xs, ys, color=color, linewidth=linewidth, label=label)
-        all_x.extend(xs)
-        all_y.extend(ys)
-        any_plotted = True
-
-    if not any_plotted:
+        all_pts.append(pts)
+        colors.append(color)
+        handles.append(Line2D([], [], color=color, linewidth=linewidth, label=label,
+                              marker='o' if markers else None, markersize=marker_size))
+
+    if not all_pts:
         raise SystemExit("No valid data to plot")
 
+    ax.add_collection(LineCollection(all_pts, colors=colors, linewidths=linewidth))
+    stacked = np.concatenate(all_pts)
+    if markers:
+        counts = [len(pts) for pts in all_pts]
+        ax.scatter(stacked[:, 0], stacked[:, 1], c=np.repeat(colors, counts),
+                   s=marker_size ** 2, zorder=2)
+
     ax.set_xlabel('s (global)')
     ax.set_ylabel('t (global)')
     if title:
@@ -102,22 +134,21 @@ def plot_files(files: List[str], title: str | None, save: str | None, show: bool
         ax.set_aspect('equal', adjustable='box')
 
     if legend:
-        ax.legend(loc='best', fontsize=9)
+        ax.legend(handles=handles, loc='best', fontsize=9)
 
     ax.grid(True, linestyle=':', linewidth=0.8, alpha=0.6)
 
     # Fit bounds with a small margin
-    if all_x and all_y:
-        xmin, xmax = min(all_x), max(all_x)
-        ymin, ymax = min(all_y), max(all_y)
-        def margin(lo, hi):
-            span = hi - lo
-            if span <= 0:
-                span = 1.0
-            pad = 0.03 * span
-            return lo - pad, hi + pad
-        ax.set_xlim(*margin(xmin, xmax))
-        ax.set_ylim(*margin(ymin, ymax))
+    xmin, ymin = stacked.min(axis=0)
+    xmax, ymax = stacked.max(axis=0)
+    def margin(lo, hi):
+        span = hi - lo
+        if span <= 0:
+            span = 1.0
+        pad = 0.03 * span
+        return lo - pad, hi + pad
+    ax.set_xlim(*margin(xmin, xmax))
+    ax.set_ylim(*margin(ymin, ymax))
 
     if save:
         out = os.path.abspath(save)
@@ -24,6 +24,8 @@ from typing import List, Tuple, Optional
 
 try:
     import matplotlib.pyplot as plt
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba
     _HAVE_MPL = True
 except Exception:
     _HAVE_MPL = False
@@ -86,22 +88,23 @@ def point_inside_triangle(Ax: float, Ay: float,
                           Bx: float, By: float,
                           Cx: float, Cy: float,
                           x: float, y: float) -> bool:
-    """Return True if point (x,y) is inside triangle ABC.
+    """Return True if point (x,y) is inside triangle ABC or on one of its edges.
 
-    Port of the JS method that uses a point-in-polygon style toggle across the three edges.
+    Sign test on the three edge cross products (inside when none of them
+    disagree in sign) instead of the JS point-in-polygon toggle across the
+    three edges, so there are no divisions; points outside the triangle's
+    y-range return before any arithmetic. A point on an edge counts as inside,
+    so it blocks the ear; the triangle's own vertices count as outside.
     """
-    inside = False
-
-    if ((x != Ax or y != Ay) and (x != Bx or y != By) and (x != Cx or y != Cy)):
-        if ((Ay < y and By >= y) or (By < y and Ay >= y)) and (Ax + (y - Ay) / (By - Ay) * (Bx - Ax) < x):
-            inside = not inside
-        if ((By < y and Cy >= y) or (Cy < y and By >= y)) and (Bx + (y - By) / (Cy - By) * (Cx - Bx) < x):
-            inside = not inside
-        if ((Cy < y and Ay >= y) or (Ay < y and Cy >= y)) and (Cx + (y - Cy) / (Ay - Cy) * (Ax - Cx) < x):
-            inside = not inside
-
-    return inside
-
+    # outside the triangle's y-range: no arithmetic needed (the common case)
+    if (y < Ay and y < By and y < Cy) or (y > Ay and y > By and y > Cy):
+        return False
+    if (x == Ax and y == Ay) or (x == Bx and y == By) or (x == Cx and y == Cy):
+        return False
+    d1 = (x - Bx) * (Ay - By) - (Ax - Bx) * (y - By)
+    d2 = (x - Cx) * (By - Cy) - (Bx - Cx) * (y - Cy)
+    d3 = (x - Ax) * (Cy - Ay) - (Cx - Ax) * (y - Ay)
+    return not ((d1 < 0.0 or d2 < 0.0 or d3 < 0.0) and (d1 > 0.0 or d2 > 0.0 or d3 > 0.0))
 
 # --- Unify polygon with one hole via shortest valid connector ---
 
@@ -110,46 +113,35 @@ def unify_outer_and_hole(outer: List[Point], hole: List[Point]) -> Optional[List
     if corners < 3 or len(hole) < 3:
         return None
 
-    min_i = -1
-    h_min_i = -1
-    min_dist2 = float('inf')
+    # Sides of both polygons as (Xk, Yk, Xl, Yl), built once for all candidates
+    hN = len(hole)
+    edges = [(*outer[k], *outer[(k + 1) % corners]) for k in range(corners)]
+    edges += [(*hole[k], *hole[(k + 1) % hN]) for k in range(hN)]
 
     def seg_intersects_connector(i_outer: int, j_hole: int) -> bool:
         Ax, Ay = outer[i_outer]
         Cx, Cy = hole[j_hole]
-        # Check against all edges of the outer polygon
-        for k in range(corners):
-            l = (k + 1) % corners
-            Bx, By = outer[i_outer]  # same as A-> sanity not used
-            Xk, Yk = outer[k]
-            Xl, Yl = outer[l]
-            if line_segments_intersect(Ax, Ay, Cx, Cy, Xk, Yk, Xl, Yl):
-                return True
-        # Check against all edges of the hole polygon
-        hN = len(hole)
-        for k in range(hN):
-            l = (k + 1) % hN
-            Xk, Yk = hole[k]
-            Xl, Yl = hole[l]
+        for Xk, Yk, Xl, Yl in edges:
             if line_segments_intersect(Ax, Ay, Cx, Cy, Xk, Yk, Xl, Yl):
                 return True
         return False
 
-    for i in range(corners):
-        for j in range(len(hole)):
-            dx = outer[i][0] - hole[j][0]
-            dy = outer[i][1] - hole[j][1]
-            dist2 = dx * dx + dy * dy
-            if dist2 < min_dist2:
-                # Ensure connector doesn't intersect any side of either polygon
-                # (The intersection test ignores identical endpoints, matching the JS behavior.)
-                if not seg_intersects_connector(i, j):
-                    min_dist2 = dist2
-                    min_i = i
-                    h_min_i = j
-
-    if min_i < 0:
-        return None
+    # Shortest connector that doesn't intersect any side of either polygon.
+    # Squared distances of all (outer, hole) pairs, flat in (i, j) order; the
+    # nearest pair is usually valid, so test it alone first and only rank the
+    # rest when it is blocked. Ties go to the first pair in (i, j) order, as in
+    # the JS scan (index() and the stable sort both keep it).
+    # (The intersection test ignores identical endpoints, matching the JS behavior.)
+    d2 = [(ox - hx) * (ox - hx) + (oy - hy) * (oy - hy)
+          for ox, oy in outer for hx, hy in hole]
+    min_i, h_min_i = divmod(d2.index(min(d2)), hN)
+    if seg_intersects_connector(min_i, h_min_i):
+        for flat in sorted(range(len(d2)), key=d2.__getitem__)[1:]:
+            min_i, h_min_i = divmod(flat, hN)
+            if not seg_intersects_connector(min_i, h_min_i):
+                break
+        else:
+            return None
 
     # Build unified polygon U by walking from outer[min_i] around, then add connector and reversed hole
     u: List[Point] = []
@@ -157,7 +149,6 @@ def unify_outer_and_hole(outer: List[Point], hole: List[Point]) -> Optional[List
     for i in range(corners + 1):
         u.append(outer[(min_i + i) % corners])
     # Hole reversed starting at h_min_i, inclusive, wrapping once
-    hN = len(hole)
     for i in range(hN + 1):
         u.append(hole[(h_min_i + hN - i) % hN])
     return u
@@ -177,6 +168,7 @@ def triangulate_simple_polygon(poly: List[Point]) -> Optional[List[Triangle]]:
     Y = [p[1] for p in poly]
     corners = len(poly)
     triangles: List[Triangle] = []
+    inside = point_inside_triangle
 
     safety = 0
     while corners >= 3 and safety < 10000:
@@ -187,23 +179,21 @@ def triangulate_simple_polygon(poly: List[Point]) -> Optional[List[Triangle]]:
             j = (i + 1) % corners
             k = (j + 1) % corners
             # Verify triangle is inside, not outside (ported condition)
-            if (X[i] != X[j] or Y[i] != Y[j]) and ( (Y[k] - Y[i]) * (X[j] - X[i]) >= (X[k] - X[i]) * (Y[j] - Y[i]) ):
+            Ax, Ay, Bx, By, Cx, Cy = X[i], Y[i], X[j], Y[j], X[k], Y[k]
+            if (Ax != Bx or Ay != By) and ( (Cy - Ay) * (Bx - Ax) >= (Cx - Ax) * (By - Ay) ):
                 # Verify the interior does not contain any other corner
-                l = 0
-                while l < corners:
-                    if point_inside_triangle(X[i], Y[i], X[j], Y[j], X[k], Y[k], X[l], Y[l]):
+                # (ear corners read once; the scan runs over all corners)
+                for x, y in zip(X, Y):
+                    if inside(Ax, Ay, Bx, By, Cx, Cy, x, y):
                         break
-                    l += 1
-                if l == corners:
+                else:
                     # Usable triangle found
-                    tri = ((X[i], Y[i]), (X[j], Y[j]), (X[k], Y[k]))
+                    tri = ((Ax, Ay), (Bx, By), (Cx, Cy))
                     triangles.append(tri)
-                    # Remove vertex j (ear clipping)
+                    # Remove vertex j (ear clipping); del shifts the tail in
+                    # one C-level move, keeping X/Y contiguous for the scan
                     corners -= 1
-                    for l2 in range(j, corners):
-                        X[l2] = X[l2 + 1]
-                        Y[l2] = Y[l2 + 1]
-                    X.pop() ; Y.pop()
+                    del X[j], Y[j]
                     progressed = True
                     # Restart scan from beginning to mimic JS pacing
                     break
@@ -255,18 +245,18 @@ def demo_polygons() -> dict:
 
 # --- Plotting ---
 
-def plot_triangulation(outer: List[Point], holes: List[List[Point]], tris: List[Triangle], title: str = "") -> None:
+def plot_triangulation(outer: List[Point], holes: List[List[Point]], tris: List[Triangle], title: str = "",
+                       ax=None) -> None:
+    """Draw one triangulation; into ax if given (shown by the caller), else in its own window."""
     if not _HAVE_MPL:
         print("matplotlib not available; skipping plot")
         return
-    import matplotlib.pyplot as plt
-    fig, ax = plt.subplots(figsize=(6,6))
-    # Draw triangles
-    for (a,b,c) in tris:
-        xs = [a[0], b[0], c[0], a[0]]
-        ys = [a[1], b[1], c[1], a[1]]
-        ax.fill(xs, ys, color='tab:red', alpha=0.25)
-        ax.plot(xs, ys, color='tab:red', linewidth=1.0)
+    own = ax is None
+    if own:
+        fig, ax = plt.subplots(figsize=(6,6))
+    # Draw triangles as one collection (translucent fill, opaque edges)
+    ax.add_collection(PolyCollection(tris, facecolors=to_rgba('tab:red', 0.25),
+                                     edgecolors='tab:red', linewidths=1.0))
     # Draw outer
     xs = [p[0] for p in outer] + [outer[0][0]]
     ys = [p[1] for p in outer] + [outer[0][1]]
@@ -279,7 +269,8 @@ def plot_triangulation(outer: List[Point], holes: List[List[Point]], tris: List[
     ax.set_aspect('equal', adjustable='box')
     ax.set_title(title or 'Triangulation')
     ax.grid(True, linestyle=':', alpha=0.4)
-    plt.show()
+    if own:
+        plt.show()
 
 
 # --- CLI ---
@@ -303,18 +294,20 @@ def load_from_json(path: str) -> Tuple[List[Point], List[List[Point]]]:
     return outer, holes
 
 
-def run_case(name: str, outer: List[Point], holes: List[List[Point]], do_plot: bool) -> None:
+def run_case(name: str, outer: List[Point], holes: List[List[Point]], do_plot: bool, ax=None) -> None:
     tris = triangulate(outer, holes)
     print(f"Case: {name}")
     if tris is None:
         print(f"  ERROR: {FAIL_MESSAGE}")
+        if ax is not None:
+            ax.set_visible(False)
         return
     print(f"  Triangles: {len(tris)}")
     # Show first few triangles as sample
     for i, t in enumerate(tris[:5]):
         print(f"   {i+1:02d}: {t}")
     if do_plot:
-        plot_triangulation(outer, holes, tris, title=name)
+        plot_triangulation(outer, holes, tris, title=name, ax=ax)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -327,9 +320,21 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     demos = demo_polygons()
     selected = args.demo or list(demos.keys())
-    for key in selected:
+    # Several plotted demos share one figure (a subplot each) and one show()
+    axes = [None] * len(selected)
+    if args.plot and _HAVE_MPL and len(selected) > 1:
+        cols = 2
+        rows = math.ceil(len(selected) / cols)
+        fig, grid = plt.subplots(rows, cols, figsize=(6 * cols, 6 * rows), squeeze=False)
+        axes = list(grid.flat)
+        for ax in axes[len(selected):]:
+            ax.set_visible(False)
+    for key, ax in zip(selected, axes):
         outer, holes = demos[key]
-        run_case(key, outer, holes, do_plot=args.plot)
+        run_case(key, outer, holes, do_plot=args.plot, ax=ax)
+    if axes[0] is not None:
+        fig.tight_layout()
+        plt.show()
 
 
 if __name__ == '__main__':